@@ -2,16 +2,24 @@
 Main entry point for LinkedIn Hiring Post Scraper.
 """
 import json
+import logging
 import os
 import sys
 import asyncio
+from operator import itemgetter
 from datetime import datetime, timedelta
-from typing import List, Dict
+from typing import List, Dict, Optional
 from scraper import LinkedInScraper
 from storage import StorageManager, write_log
-from utils import calculate_relevance_score, deduplicate_posts
+from utils import KeywordMatcher, calculate_relevance_scores, deduplicate_posts
 from parser import clean_post_data
 
+try:
+    import orjson
+except ImportError:
+    # Fallback to the standard library parser
+    orjson = None
+
 
 def load_config(config_file: str = "config.json") -> dict:
     """
@@ -27,14 +35,48 @@ def load_config(config_file: str = "config.json") -> dict:
         print(f"Error: Config file '{config_file}' not found.")
         sys.exit(1)
     
+    if orjson is not None:
+        with open(config_file, 'rb') as f:
+            return orjson.loads(f.read())
+    
     with open(config_file, 'r') as f:
         return json.load(f)
 
 
+def parse_post_date(date_posted) -> Optional[datetime]:
+    """
+    Convert a post's date_posted value to a naive local datetime.
+    
+    Timezone-aware values (e.g. ISO strings ending in 'Z') are converted to
+    local time so they can be compared with datetime.now().
+    
+    Args:
+        date_posted: datetime object or ISO date string
+        
+    Returns:
+        Naive datetime, or None if the value is missing or unparseable
+    """
+    if isinstance(date_posted, str):
+        try:
+            date_posted = datetime.fromisoformat(date_posted.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+    
+    if not isinstance(date_posted, datetime):
+        return None
+    
+    if date_posted.tzinfo is not None:
+        date_posted = date_posted.astimezone().replace(tzinfo=None)
+    
+    return date_posted
+
+
 def filter_posts_by_date(posts: List[Dict], days_limit: int) -> List[Dict]:
     """
     Filter posts by date (only keep posts within days_limit).
     
+    Posts with a missing or unparseable date are kept.
+    
     Args:
         posts: List of post dictionaries
         days_limit: Maximum number of days ago to include
@@ -46,46 +88,41 @@ def filter_posts_by_date(posts: List[Dict], days_limit: int) -> List[Dict]:
         return posts
     
     cutoff_date = datetime.now() - timedelta(days=days_limit)
-    filtered = []
     
+    filtered = []
     for post in posts:
-        date_posted = post.get('date_posted')
-        if isinstance(date_posted, datetime):
-            if date_posted >= cutoff_date:
-                filtered.append(post)
-        elif isinstance(date_posted, str):
-            try:
-                date_obj = datetime.fromisoformat(date_posted.replace('Z', '+00:00'))
-                if date_obj >= cutoff_date:
-                    filtered.append(post)
-            except:
-                # If date parsing fails, include the post
-                filtered.append(post)
-        else:
-            # If no date, include the post
+        date_obj = parse_post_date(post.get('date_posted'))
+        if date_obj is None or date_obj >= cutoff_date:
             filtered.append(post)
     
     return filtered
 
 
-def score_and_rank_posts(posts: List[Dict], keywords: List[str]) -> List[Dict]:
+def score_and_rank_posts(posts: List[Dict], matcher: KeywordMatcher) -> List[Dict]:
     """
-    Calculate relevance scores and rank posts.
+    Clean, score and rank posts.
+    
+    Each post is cleaned in place and its normalized text collected in the
+    same pass, so the posts are only traversed once before scoring.
     
     Args:
         posts: List of post dictionaries
-        keywords: List of keywords for scoring
+        matcher: KeywordMatcher built from the scoring keywords
         
     Returns:
-        List of posts with scores, sorted by score (descending)
+        List of cleaned posts with scores, sorted by score (descending)
     """
+    texts = []
     for post in posts:
-        text = post.get('text', '')
-        score = calculate_relevance_score(text, keywords)
+        clean_post_data(post)
+        texts.append(post.get('text', ''))
+    
+    scores = calculate_relevance_scores(texts, matcher)
+    for post, score in zip(posts, scores):
         post['score'] = score
     
-    # Sort by score descending
-    posts.sort(key=lambda x: x.get('score', 0), reverse=True)
+    # Sort by score descending (stable, so ties keep scrape order)
+    posts.sort(key=itemgetter('score'), reverse=True)
     
     return posts
 
@@ -104,11 +141,13 @@ def print_top_posts(posts: List[Dict], limit: int = 5):
     
     top_posts = posts[:limit]
     
-    print("\n" + "="*100)
-    print(f"TOP {len(top_posts)} HIRING POSTS (by relevance score)")
-    print("="*100)
-    print(f"{'Date':<12} {'Author':<25} {'Score':<6} {'Text Snippet':<50}")
-    print("-"*100)
+    lines = [
+        "\n" + "="*100,
+        f"TOP {len(top_posts)} HIRING POSTS (by relevance score)",
+        "="*100,
+        f"{'Date':<12} {'Author':<25} {'Score':<6} {'Text Snippet':<50}",
+        "-"*100,
+    ]
     
     for post in top_posts:
         date = post.get('date_posted', '')
@@ -121,9 +160,48 @@ def print_top_posts(posts: List[Dict], limit: int = 5):
         score = post.get('score', 0)
         snippet = post.get('text_snippet', '')[:48]
         
-        print(f"{date_str:<12} {author:<25} {score:<6} {snippet:<50}")
-        print(f"{'':12} {'URL: ' + post.get('post_url', '')[:80]}")
-        print("-"*100)
+        lines.append(f"{date_str:<12} {author:<25} {score:<6} {snippet:<50}")
+        lines.append(f"{'':12} {'URL: ' + post.get('post_url', '')[:80]}")
+        lines.append("-"*100)
+    
+    # Write the whole table with a single print call
+    print("\n".join(lines))
+
+
+def use_fast_event_loop():
+    """
+    Switch asyncio to uvloop's event loop when it is installed.
+    
+    uvloop is not available on Windows, so the default loop is kept there.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return
+    
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
+class _ConsoleFormatter(logging.Formatter):
+    """Prints progress messages bare and prefixes warnings and errors with their level."""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        message = super().format(record)
+        if record.levelno >= logging.WARNING:
+            return f"{record.levelname}: {message}"
+        return message
+
+
+def configure_logging(level: int = logging.INFO):
+    """
+    Send the scraper's log messages to the console.
+    
+    Args:
+        level: Minimum level to show (logging.DEBUG also shows every extracted post)
+    """
+    handler = logging.StreamHandler()
+    handler.setFormatter(_ConsoleFormatter('%(message)s'))
+    logging.basicConfig(level=level, handlers=[handler])
 
 
 async def main():
@@ -140,11 +218,20 @@ async def main():
     
     # Get scraping config
     scraping_config = config.get('scraping', {})
-    headless = scraping_config.get('headless', False)
+    headless = scraping_config.get('headless', True)
     delay = scraping_config.get('delay_between_requests', 2)
     max_posts = scraping_config.get('max_posts_per_search', 50)
     timeout = scraping_config.get('timeout', 30000)
     
+    # Get storage paths
+    storage_config = config.get('storage', {})
+    csv_file = storage_config.get('csv_file', 'output.csv')
+    db_file = storage_config.get('db_file', 'output.db')
+    log_file = storage_config.get('log_file', 'logs/last_run.txt')
+    csv_path = os.path.abspath(csv_file)
+    db_path = os.path.abspath(db_file)
+    log_path = os.path.abspath(log_file)
+    
     print(f"\n{'='*100}")
     print(f"CONFIGURATION LOADED:")
     print(f"{'='*100}")
@@ -168,9 +255,6 @@ async def main():
         if not posts:
             print("WARNING: No posts found. Make sure you're logged in (cookies.json exists).")
             # Still show where data would be saved
-            import os
-            csv_path = os.path.abspath(config.get('storage', {}).get('csv_file', 'output.csv'))
-            db_path = os.path.abspath(config.get('storage', {}).get('db_file', 'output.db'))
             print(f"\nData would be saved to:")
             print(f"   CSV File: {csv_path}")
             print(f"   SQLite Database: {db_path}")
@@ -193,23 +277,17 @@ async def main():
             print("   This might indicate missing post_urls. Checking...")
             # Don't re-scrape, just show where data would be saved
         
-        # Score and rank posts
-        posts = score_and_rank_posts(posts, keywords)
+        # Clean, score and rank posts
+        posts = score_and_rank_posts(posts, KeywordMatcher(keywords))
         print(f"Posts scored and ranked by relevance")
         
-        # Clean post data
-        posts = [clean_post_data(post) for post in posts]
-        
         # Save to storage (even if empty, show where it would be saved)
-        import os
-        csv_file = config.get('storage', {}).get('csv_file', 'output.csv')
-        db_file = config.get('storage', {}).get('db_file', 'output.db')
-        csv_path = os.path.abspath(csv_file)
-        db_path = os.path.abspath(db_file)
-        
         if posts:
             storage = StorageManager(csv_file=csv_file, db_file=db_file)
-            storage.save_posts(posts)
+            try:
+                storage.save_posts(posts)
+            finally:
+                storage.close()
             print(f"\nSaved {len(posts)} posts to storage")
         else:
             print(f"\nWARNING: No posts to save (all removed during processing)")
@@ -218,18 +296,11 @@ async def main():
             print(f"   DB: {db_path}")
         
         # Write log
-        log_file = config.get('storage', {}).get('log_file', 'logs/last_run.txt')
         write_log(log_file, f"Scraped {len(posts)} posts. Top score: {posts[0].get('score', 0) if posts else 0}")
         
         # Print top posts
         print_top_posts(posts, limit=5)
         
-        # Get absolute paths for clarity
-        import os
-        csv_path = os.path.abspath(config.get('storage', {}).get('csv_file', 'output.csv'))
-        db_path = os.path.abspath(config.get('storage', {}).get('db_file', 'output.db'))
-        log_path = os.path.abspath(log_file)
-        
         print(f"\n{'='*100}")
         print(f"SCRAPING COMPLETE!")
         print(f"{'='*100}")
@@ -249,20 +320,18 @@ async def main():
     
     except KeyboardInterrupt:
         print("\n\nScraping interrupted by user.")
-        print("Your login session is saved. Browser will stay open.")
     except Exception as e:
         print(f"\nERROR: Error during scraping: {e}")
         import traceback
         traceback.print_exc()
-        print("\nYour login session is saved. Browser will stay open.")
     finally:
-        # Don't close browser - let user close manually to preserve session
-        print("\nTip: Keep the browser window open to preserve your login session.")
-        print("   Close it manually when you're done.")
-        # await scraper.close()  # Commented out to preserve session
+        # Saves the login session for the next run before closing the browser
+        await scraper.close()
 
 
 if __name__ == "__main__":
     # Run async main function
+    configure_logging()
+    use_fast_event_loop()
     asyncio.run(main())
 
@@ -2,18 +2,52 @@
 Parser module for extracting and cleaning post data from LinkedIn.
 """
 from bs4 import BeautifulSoup
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Optional, Dict
+import calendar
+import logging
 import re
 from utils import normalize_text, extract_text_snippet
 
+logger = logging.getLogger(__name__)
 
-def parse_post_element(element, base_url: str = "https://www.linkedin.com") -> Optional[Dict]:
+
+LINKEDIN_BASE_URL = "https://www.linkedin.com"
+
+# Patterns used on every parsed post, compiled once at import time
+_POST_HREF_RE = re.compile(r'/posts/')
+_AUTHOR_HREF_RE = re.compile(r'/in/')
+_DESC_CLASS_RE = re.compile(r'feed-shared-update-v2__description')
+_TEXT_CLASS_RE = re.compile(r'text')
+_ENGAGEMENT_RES = {
+    'like': re.compile(r'.*like.*', re.I),
+    'comment': re.compile(r'.*comment.*', re.I),
+}
+_REL_DATE_RE = re.compile(r'(\d+)\s*(hour|day|week|month)')
+
+
+def absolute_url(url: str, base_url: str = LINKEDIN_BASE_URL) -> str:
+    """
+    Make a site-relative LinkedIn URL absolute.
+    
+    Args:
+        url: Absolute URL or path starting with '/'
+        base_url: Base URL prepended to relative paths
+        
+    Returns:
+        Absolute URL
+    """
+    if url and url[0] == '/':
+        return base_url + url
+    return url
+
+
+def parse_post_element(element, base_url: str = LINKEDIN_BASE_URL) -> Optional[Dict]:
     """
     Parse a single LinkedIn post element and extract relevant data.
     
     Args:
-        element: BeautifulSoup element or Playwright element data
+        element: Raw post HTML, BeautifulSoup element or Playwright element data
         base_url: Base URL for constructing full URLs
         
     Returns:
@@ -24,30 +58,33 @@ def parse_post_element(element, base_url: str = "https://www.linkedin.com") -> O
         if isinstance(element, dict):
             return element
         
+        # If element is raw HTML, parse it once with the lxml backend
+        # (C parser, much faster than the default html.parser)
+        if isinstance(element, str):
+            element = BeautifulSoup(element, 'lxml')
+        
         # If element is BeautifulSoup, parse it
         if hasattr(element, 'get'):
             # Extract post URL
-            post_url_elem = element.find('a', href=re.compile(r'/posts/'))
+            post_url_elem = element.find('a', href=_POST_HREF_RE)
             post_url = None
             if post_url_elem and post_url_elem.get('href'):
-                href = post_url_elem.get('href')
-                post_url = href if href.startswith('http') else base_url + href
+                post_url = absolute_url(post_url_elem.get('href'), base_url)
             
             # Extract author info
-            author_elem = element.find('a', href=re.compile(r'/in/'))
+            author_elem = element.find('a', href=_AUTHOR_HREF_RE)
             author_url = None
             author_name = None
             if author_elem:
-                href = author_elem.get('href', '')
-                author_url = href if href.startswith('http') else base_url + href
+                author_url = absolute_url(author_elem.get('href', ''), base_url)
                 author_name = normalize_text(author_elem.get_text())
             
             # Extract post text
-            text_elem = element.find('div', class_=re.compile(r'feed-shared-update-v2__description'))
+            text_elem = element.find('div', class_=_DESC_CLASS_RE)
             if not text_elem:
                 text_elem = element.find('span', {'dir': 'ltr'})
             if not text_elem:
-                text_elem = element.find('div', class_=re.compile(r'text'))
+                text_elem = element.find('div', class_=_TEXT_CLASS_RE)
             
             text = ""
             if text_elem:
@@ -82,22 +119,25 @@ def parse_post_element(element, base_url: str = "https://www.linkedin.com") -> O
                 'text_snippet': extract_text_snippet(text),
                 'date_posted': date_posted or datetime.now(),
                 'likes': likes,
-                'comments': comments
+                'comments': comments,
+                '_normalized': True
             }
     
     except Exception as e:
-        print(f"Error parsing post element: {e}")
+        logger.error("Error parsing post element: %s", e)
         return None
     
     return None
 
 
-def parse_relative_date(date_text: str) -> Optional[datetime]:
+def parse_relative_date(date_text: str, now: Optional[datetime] = None) -> Optional[datetime]:
     """
     Parse relative date strings like "2 hours ago", "3 days ago".
     
     Args:
         date_text: Relative date string
+        now: Reference time (defaults to datetime.now()); pass one value
+            when parsing a batch so the clock is read once
         
     Returns:
         Datetime object or None if parsing fails
@@ -106,25 +146,27 @@ def parse_relative_date(date_text: str) -> Optional[datetime]:
         return None
     
     date_text = date_text.lower().strip()
-    now = datetime.now()
+    if now is None:
+        now = datetime.now()
     
     # Match patterns like "2 hours ago", "3 days ago"
-    patterns = [
-        (r'(\d+)\s*hour', lambda x: now.replace(hour=now.hour - int(x))),
-        (r'(\d+)\s*day', lambda x: now.replace(day=now.day - int(x))),
-        (r'(\d+)\s*week', lambda x: now.replace(day=now.day - int(x) * 7)),
-        (r'(\d+)\s*month', lambda x: now.replace(month=now.month - int(x))),
-    ]
-    
-    for pattern, func in patterns:
-        match = re.search(pattern, date_text)
-        if match:
-            try:
-                return func(match.group(1))
-            except:
-                pass
+    match = _REL_DATE_RE.search(date_text)
+    if not match:
+        return now
+    
+    amount, unit = int(match.group(1)), match.group(2)
+    if unit == 'month':
+        return _subtract_months(now, amount)
     
-    return now
+    return now - timedelta(**{unit + 's': amount})
+
+
+def _subtract_months(date: datetime, months: int) -> datetime:
+    """Subtract calendar months, clamping the day to the target month's length."""
+    year, month = divmod(date.year * 12 + date.month - 1 - months, 12)
+    month += 1
+    day = min(date.day, calendar.monthrange(year, month)[1])
+    return date.replace(year=year, month=month, day=day)
 
 
 def extract_engagement(element, metric_type: str) -> int:
@@ -140,7 +182,7 @@ def extract_engagement(element, metric_type: str) -> int:
     """
     try:
         # Look for engagement indicators
-        pattern = re.compile(f'.*{metric_type}.*', re.I)
+        pattern = _ENGAGEMENT_RES.get(metric_type) or re.compile(f'.*{metric_type}.*', re.I)
         engagement_elem = element.find(string=pattern)
         
         if engagement_elem:
@@ -156,37 +198,35 @@ def extract_engagement(element, metric_type: str) -> int:
 
 def clean_post_data(post: Dict) -> Dict:
     """
-    Clean and normalize post data.
+    Clean and normalize post data in place.
+    
+    Text normalization is skipped for posts already marked with the
+    '_normalized' flag (set by parse_post_element and by this function),
+    so cleaning the same post twice does not re-process its text.
     
     Args:
         post: Raw post dictionary
         
     Returns:
-        Cleaned post dictionary
+        The same post dictionary, cleaned
     """
-    cleaned = post.copy()
-    
     # Normalize text fields
-    if 'text' in cleaned:
-        cleaned['text'] = normalize_text(cleaned['text'])
-        cleaned['text_snippet'] = extract_text_snippet(cleaned['text'])
+    if 'text' in post and not post.get('_normalized'):
+        post['text'] = normalize_text(post['text'])
+        post['text_snippet'] = extract_text_snippet(post['text'])
+        post['_normalized'] = True
     
     # Ensure URLs are complete
-    if 'post_url' in cleaned and cleaned['post_url']:
-        if not cleaned['post_url'].startswith('http'):
-            cleaned['post_url'] = 'https://www.linkedin.com' + cleaned['post_url']
-    
-    if 'author_url' in cleaned and cleaned['author_url']:
-        if not cleaned['author_url'].startswith('http'):
-            cleaned['author_url'] = 'https://www.linkedin.com' + cleaned['author_url']
+    for field in ('post_url', 'author_url'):
+        if post.get(field):
+            post[field] = absolute_url(post[field])
     
     # Ensure date is datetime object
-    if 'date_posted' in cleaned:
-        if isinstance(cleaned['date_posted'], str):
+    if 'date_posted' in post:
+        if isinstance(post['date_posted'], str):
             try:
-                cleaned['date_posted'] = datetime.fromisoformat(cleaned['date_posted'])
+                post['date_posted'] = datetime.fromisoformat(post['date_posted'])
             except:
-                cleaned['date_posted'] = datetime.now()
+                post['date_posted'] = datetime.now()
     
-    return cleaned
-
+    return post
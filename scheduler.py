@@ -1,29 +1,27 @@
 """
 Scheduler module for running the LinkedIn scraper periodically.
-Supports both cron-style scheduling and Python schedule library.
+Supports both cron-style scheduling and an in-process asyncio scheduler.
 """
 import asyncio
-import schedule
-import time
-from datetime import datetime
+from datetime import datetime, timedelta
 import sys
 import os
 
 # Add parent directory to path to import main module
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from main import main as run_scraper
+from main import main as run_scraper, configure_logging, use_fast_event_loop
 
 
-def run_scheduled_scrape():
-    """Wrapper to run the async scraper in a scheduled context."""
+async def run_scheduled_scrape():
+    """Run the async scraper inside the scheduler's event loop."""
     print(f"\n{'='*80}")
     print(f"Scheduled run at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"{'='*80}\n")
     
     try:
-        # Run the async main function
-        asyncio.run(run_scraper())
+        # Await the scraper directly so every run shares one event loop
+        await run_scraper()
         print(f"\nScheduled scrape completed at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     except Exception as e:
         print(f"\nERROR: Error in scheduled scrape: {e}")
@@ -31,33 +29,53 @@ def run_scheduled_scrape():
         traceback.print_exc()
 
 
-def setup_daily_schedule(hour: int = 9, minute: int = 0):
+def seconds_until(hour: int, minute: int) -> float:
     """
-    Set up daily schedule at specified time.
+    Calculate seconds until the next occurrence of a time of day.
     
     Args:
         hour: Hour of day (0-23)
         minute: Minute of hour (0-59)
+        
+    Returns:
+        Number of seconds to wait
     """
-    schedule.every().day.at(f"{hour:02d}:{minute:02d}").do(run_scheduled_scrape)
-    print(f"Scheduled daily runs at {hour:02d}:{minute:02d}")
+    now = datetime.now()
+    next_run = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    if next_run <= now:
+        next_run += timedelta(days=1)
+    return (next_run - now).total_seconds()
 
 
-def setup_hourly_schedule():
-    """Set up hourly schedule."""
-    schedule.every().hour.do(run_scheduled_scrape)
-    print("Scheduled hourly runs")
+async def daily_schedule(hour: int = 9, minute: int = 0):
+    """
+    Run the scraper every day at the specified time.
+    
+    Args:
+        hour: Hour of day (0-23)
+        minute: Minute of hour (0-59)
+    """
+    print(f"Scheduled daily runs at {hour:02d}:{minute:02d}")
+    while True:
+        await asyncio.sleep(seconds_until(hour, minute))
+        await run_scheduled_scrape()
 
 
-def setup_custom_schedule(interval_minutes: int):
+async def interval_schedule(interval_minutes: int):
     """
-    Set up custom interval schedule.
+    Run the scraper at a fixed interval.
     
     Args:
         interval_minutes: Minutes between runs
     """
-    schedule.every(interval_minutes).minutes.do(run_scheduled_scrape)
-    print(f"Scheduled runs every {interval_minutes} minutes")
+    if interval_minutes == 60:
+        print("Scheduled hourly runs")
+    else:
+        print(f"Scheduled runs every {interval_minutes} minutes")
+    
+    while True:
+        await asyncio.sleep(interval_minutes * 60)
+        await run_scheduled_scrape()
 
 
 def run_scheduler():
@@ -76,19 +94,19 @@ def run_scheduler():
     choice = input("\nEnter choice (1-6): ").strip()
     
     if choice == "1":
-        setup_daily_schedule(9, 0)
+        job = daily_schedule(9, 0)
     elif choice == "2":
-        setup_hourly_schedule()
+        job = interval_schedule(60)
     elif choice == "3":
-        setup_custom_schedule(360)  # 6 hours
+        job = interval_schedule(360)  # 6 hours
     elif choice == "4":
-        setup_custom_schedule(720)  # 12 hours
+        job = interval_schedule(720)  # 12 hours
     elif choice == "5":
         minutes = int(input("Enter interval in minutes: "))
-        setup_custom_schedule(minutes)
+        job = interval_schedule(minutes)
     elif choice == "6":
         print("\nRunning scraper once...")
-        run_scheduled_scrape()
+        asyncio.run(run_scheduled_scrape())
         return
     else:
         print("Invalid choice. Exiting.")
@@ -97,13 +115,14 @@ def run_scheduler():
     print("\nScheduler started. Press Ctrl+C to stop.\n")
     
     try:
-        while True:
-            schedule.run_pending()
-            time.sleep(60)  # Check every minute
+        # Sleeps until the next run instead of polling every minute
+        asyncio.run(job)
     except KeyboardInterrupt:
         print("\n\nScheduler stopped by user.")
 
 
 if __name__ == "__main__":
+    configure_logging()
+    use_fast_event_loop()
     run_scheduler()
 
@@ -3,19 +3,176 @@ Scraper module using Playwright to extract LinkedIn posts.
 """
 import asyncio
 import json
+import logging
 import os
+import re
+import sys
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Set
+from urllib.parse import quote, urlsplit
 from playwright.async_api import async_playwright, Browser, Page, TimeoutError as PlaywrightTimeoutError
-from parser import clean_post_data
+from parser import clean_post_data, parse_relative_date
 from storage import StorageManager
+from utils import fallback_post_url
+
+logger = logging.getLogger(__name__)
+
+
+# Content search results page; the query must be URL-encoded
+SEARCH_URL_TMPL = "https://www.linkedin.com/search/results/content/?keywords={}"
+
+# Matches a rendered feed/search post; used to detect when a page is ready
+POSTS_READY_SELECTOR = 'div[data-id*="urn:li:activity"], div.feed-shared-update-v2'
+
+# Known post containers, in order of preference
+POST_SELECTORS = [
+    'div[data-id*="urn:li:activity"]',
+    'div.feed-shared-update-v2',
+    'article.feed-shared-update-v2',
+    'div[data-urn*="urn:li:activity"]',
+    'div.update-components-actor',
+]
+
+# Matches any of POST_SELECTORS, so one wait covers them all
+POST_SELECTORS_JOINED = ", ".join(POST_SELECTORS)
+
+# Post-like elements to fall back on when none of the known post selectors match
+FALLBACK_POST_SELECTOR = 'div[class*="feed" i], div[class*="update" i], div[class*="post" i]'
+
+# Posts extracted per page
+MAX_POSTS_PER_PAGE = 20
+
+# Reads the raw fields of each post element in the browser, so a whole page
+# of posts comes back as plain data in one round-trip
+EXTRACT_POSTS_JS = """(elements, limit) => elements.slice(0, limit).map((el) => {
+    const first = (selector) => el.querySelector(selector);
+    const innerText = (selector) => {
+        const node = first(selector);
+        return node ? node.innerText : null;
+    };
+    
+    const postLink = first('a[href*="/posts/"]');
+    const authorLink = first('a[href*="/in/"]');
+    const time = first('time');
+    
+    let text = '';
+    for (const selector of ['div.feed-shared-update-v2__description', 'span[dir="ltr"]', 'div.feed-shared-text-view']) {
+        text = innerText(selector);
+        if (text) break;
+    }
+    
+    return {
+        post_url: postLink ? postLink.getAttribute('href') : null,
+        author_url: authorLink ? authorLink.getAttribute('href') : null,
+        author_name: authorLink ? authorLink.innerText : null,
+        text: text || (el.innerText || '').trim(),
+        datetime: time ? time.getAttribute('datetime') : null,
+        date_text: time ? time.innerText : null,
+        likes_text: innerText('button[aria-label*="like"], span[class*="reactions"]'),
+        comments_text: innerText('button[aria-label*="comment"], span[class*="comments"]'),
+    };
+})"""
+
+# Scrolls to the bottom until target_total posts are rendered, a scroll adds
+# no posts or leaves the page height unchanged, or max_scrolls is reached
+SCROLL_TO_LOAD_JS = """async ([postSelector, targetTotal, maxScrolls, pauseMs]) => {
+    const countPosts = () => document.querySelectorAll(postSelector).length;
+    let lastCount = countPosts();
+    let lastHeight = document.body.scrollHeight;
+    for (let i = 0; i < maxScrolls && lastCount < targetTotal; i++) {
+        window.scrollTo(0, lastHeight);
+        await new Promise((resolve) => setTimeout(resolve, pauseMs));
+        const count = countPosts();
+        const height = document.body.scrollHeight;
+        if (count === lastCount || height === lastHeight) break;
+        lastCount = count;
+        lastHeight = height;
+    }
+}"""
+
+# Time given to the page to load more posts after each scroll
+SCROLL_PAUSE_MS = 1000
+
+# Chromium flags that trim memory use (GPU, raster and renderer process overhead)
+BROWSER_ARGS = [
+    '--disable-blink-features=AutomationControlled',
+    '--disable-gpu',
+    '--disable-dev-shm-usage',
+    '--disable-accelerated-2d-canvas',
+    '--disable-mipmap-generation',
+    '--disable-partial-raster',
+    '--renderer-process-limit=2',
+]
+
+# Requests the scraper never needs (only post text and links are extracted)
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font"}
+# Hosts blocked along with all their subdomains (see _is_blocked_url)
+BLOCKED_DOMAINS = ("doubleclick.net", "google-analytics.com", "googletagmanager.com", "ads.linkedin.com")
+
+# datetime.fromisoformat accepts a trailing 'Z' from Python 3.11 on
+_NATIVE_Z = sys.version_info >= (3, 11)
+
+# First number in an engagement label, with LinkedIn's optional K/M abbreviation
+_DIGITS_RE = re.compile(r'(\d+(?:\.\d+)?)(?:\s*([KkMm])\b)?')
+_COUNT_SCALE = {'k': 1_000, 'm': 1_000_000}
+
+
+def _parse_count(text: str) -> int:
+    """
+    Parse an engagement count such as "42", "1,234" or "1.2K".
+    
+    Args:
+        text: Label text containing the count
+        
+    Returns:
+        The count, or 0 if the text has no number
+    """
+    match = _DIGITS_RE.search(text.replace(',', ''))
+    if not match:
+        return 0
+    
+    number, suffix = match.groups()
+    if suffix:
+        return round(float(number) * _COUNT_SCALE[suffix.lower()])
+    return int(float(number))
+
+
+def _is_blocked_url(url: str) -> bool:
+    """
+    Check whether a request goes to one of BLOCKED_DOMAINS.
+    
+    Only the host is compared, so lookalike hosts (uploads.linkedin.com)
+    and blocked domains mentioned in a query string are not matched.
+    
+    Args:
+        url: Request URL
+        
+    Returns:
+        True if the host is a blocked domain or one of its subdomains
+    """
+    try:
+        host = urlsplit(url).hostname
+    except ValueError:
+        return False
+    if not host:
+        return False
+    return any(host == domain or host.endswith('.' + domain) for domain in BLOCKED_DOMAINS)
 
 
 class LinkedInScraper:
     """
     LinkedIn scraper using Playwright for dynamic content rendering.
+    
+    All instances share one Playwright driver and one Chromium process
+    (reference counted); each instance only opens its own browser context.
     """
     
+    _playwright = None
+    _browser: Optional[Browser] = None
+    _refcount = 0
+    _browser_lock: Optional[asyncio.Lock] = None
+    
     def __init__(self, config: dict, cookies_file: Optional[str] = None):
         """
         Initialize LinkedIn scraper.
@@ -26,85 +183,55 @@ class LinkedInScraper:
         """
         self.config = config
         self.cookies_file = cookies_file or "cookies.json"
+        # Playwright storage state holding the already-normalized cookies
+        self.state_file = self.cookies_file + ".state.json"
+        
+        # Scraping settings, read once
+        scraping_config = config.get('scraping', {})
+        self._headless = scraping_config.get('headless', True)
+        self._timeout = scraping_config.get('timeout', 30000)
+        self._delay = scraping_config.get('delay_between_requests', 2)
+        self._max_posts = scraping_config.get('max_posts_per_search', 50)
+        self._max_total_posts = scraping_config.get('max_total_posts')
+        self._max_concurrency = scraping_config.get('max_concurrency', 3)
+        # Zero, negative or unset disables context rotation
+        self._rotate_every = max(scraping_config.get('rotate_context_every', 25) or 0, 0)
+        self._block_resources = scraping_config.get('block_resources', True)
+        
         self.browser: Optional[Browser] = None
         self.context = None
         self.page: Optional[Page] = None
         self.playwright = None
-        self.storage = StorageManager(
-            csv_file=config.get('storage', {}).get('csv_file', 'output.csv'),
-            db_file=config.get('storage', {}).get('db_file', 'output.db')
-        )
+        self._nav_count = 0
+        self._seen_urls: Set[str] = set()
+        self._page_pool: Optional[asyncio.Queue] = None
+        # StorageManager creates the database, so it is only built when first used
+        self._storage_config = config.get('storage', {})
+        self._storage: Optional[StorageManager] = None
+    
+    @property
+    def storage(self) -> StorageManager:
+        """Storage manager for the configured CSV and database files, created on first access."""
+        if self._storage is None:
+            self._storage = StorageManager(
+                csv_file=self._storage_config.get('csv_file', 'output.csv'),
+                db_file=self._storage_config.get('db_file', 'output.db')
+            )
+        return self._storage
     
     async def start_browser(self):
-        """Start Playwright browser with persistent user data to save login session."""
-        self.playwright = await async_playwright().start()
-        browser_config = self.config.get('scraping', {})
-        headless = browser_config.get('headless', False)
-        self.timeout = browser_config.get('timeout', 30000)  # Store timeout for use throughout
-        
-        # Use persistent user data directory to save login session
-        user_data_dir = os.path.join(os.path.expanduser('~'), '.linkedin_scraper_browser')
-        os.makedirs(user_data_dir, exist_ok=True)
+        """Start the Playwright browser and restore the saved login session."""
+        if self.browser is None:
+            await self._acquire_browser()
         
-        print(f"Using persistent browser data directory: {user_data_dir}")
-        print("This will save your LinkedIn login session between runs.")
-        
-        # Launch browser with persistent user data directory
-        try:
-            self.browser = await self.playwright.chromium.launch_persistent_context(
-                user_data_dir=user_data_dir,
-                headless=headless,
-                viewport={"width": 1920, "height": 1080},
-                user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                locale='en-US',
-                extra_http_headers={
-                    'Accept-Language': 'en-US,en;q=0.9',
-                },
-                args=[
-                    '--disable-blink-features=AutomationControlled',
-                ]
-            )
-            # With persistent context, browser is the context
-            self.context = self.browser
-            
-            # Get existing page or create new one
-            if len(self.context.pages) > 0:
-                self.page = self.context.pages[0]
-            else:
-                self.page = await self.context.new_page()
-            
-            # Add script to hide webdriver property
-            try:
-                await self.context.add_init_script("""
-                    Object.defineProperty(navigator, 'webdriver', {
-                        get: () => undefined
-                    });
-                """)
-            except Exception as e:
-                print(f"Warning: Could not add init script: {e}")
-                
-        except Exception as e:
-            print(f"Error launching persistent browser: {e}")
-            print("Falling back to regular browser launch...")
-            # Fallback to regular browser if persistent context fails
-            try:
-                self.browser = await self.playwright.chromium.launch(
-                    headless=headless,
-                    args=[
-                        '--disable-blink-features=AutomationControlled',
-                    ]
-                )
-                self.context = await self.browser.new_context(
-                    viewport={"width": 1920, "height": 1080},
-                    user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                )
-                self.page = await self.context.new_page()
-            except Exception as fallback_error:
-                print(f"Error with fallback browser: {fallback_error}")
-                raise
+        # Reuse cookies normalized by a previous run when they are still current
+        state = self._load_session_state()
+        await self._launch_context(storage_state=state)
+        if state is not None:
+            logger.info("Loaded %d cookies from %s", len(state.get('cookies', [])), self.state_file)
         
         # Load and add cookies if available
-        if os.path.exists(self.cookies_file):
+        if state is None and os.path.exists(self.cookies_file):
             try:
                 with open(self.cookies_file, 'r') as f:
                     cookies = json.load(f)
@@ -146,63 +273,230 @@ class LinkedInScraper:
                     try:
                         # Check if page is still valid before navigation
                         if self.page.is_closed():
-                            print("Page was closed, recreating...")
+                            logger.info("Page was closed, recreating...")
                             self.page = await self.context.new_page()
                         
-                        timeout = self.config.get('scraping', {}).get('timeout', 30000)
-                        await self.page.goto("https://www.linkedin.com", wait_until="domcontentloaded", timeout=timeout)
-                        await asyncio.sleep(2)  # Give it more time
+                        await self.page.goto("https://www.linkedin.com", wait_until="commit", timeout=self._timeout)
                         
                         # Check if page is still valid after navigation
                         if self.page.is_closed():
-                            print("Page was closed after navigation, recreating...")
+                            logger.info("Page was closed after navigation, recreating...")
                             self.page = await self.context.new_page()
-                            timeout = self.config.get('scraping', {}).get('timeout', 30000)
-                            await self.page.goto("https://www.linkedin.com", wait_until="domcontentloaded", timeout=timeout)
-                            await asyncio.sleep(1)
+                            await self.page.goto("https://www.linkedin.com", wait_until="commit", timeout=self._timeout)
                         
                         # Add cookies to context
                         try:
                             await self.context.add_cookies(normalized_cookies)
-                            print(f"Loaded {len(normalized_cookies)} cookies from {self.cookies_file}")
+                            logger.info("Loaded %d cookies from %s", len(normalized_cookies), self.cookies_file)
+                            await self._save_session_state()
                         except Exception as cookie_error:
-                            print(f"Warning: Could not add cookies: {cookie_error}")
+                            logger.warning("Could not add cookies: %s", cookie_error)
                     except Exception as nav_error:
-                        print(f"Warning: Navigation error: {nav_error}")
+                        logger.warning("Navigation error: %s", nav_error)
                         # Check if we need to recreate the page
                         if self.page.is_closed() or 'TargetClosedError' in str(type(nav_error)):
-                            print("Recreating page after error...")
+                            logger.info("Recreating page after error...")
                             try:
                                 self.page = await self.context.new_page()
-                                timeout = self.config.get('scraping', {}).get('timeout', 30000)
-                                await self.page.goto("https://www.linkedin.com", wait_until="domcontentloaded", timeout=timeout)
-                                await asyncio.sleep(1)
+                                await self.page.goto("https://www.linkedin.com", wait_until="commit", timeout=self._timeout)
                                 # Try to add cookies
                                 await self.context.add_cookies(normalized_cookies)
-                                print(f"Loaded {len(normalized_cookies)} cookies from {self.cookies_file}")
+                                logger.info("Loaded %d cookies from %s", len(normalized_cookies), self.cookies_file)
+                                await self._save_session_state()
                             except Exception as retry_error:
-                                print(f"Warning: Could not recover from navigation error: {retry_error}")
+                                logger.warning("Could not recover from navigation error: %s", retry_error)
             except Exception as e:
-                print(f"Warning: Could not load cookies: {e}")
-                import traceback
-                traceback.print_exc()
+                logger.warning("Could not load cookies: %s", e, exc_info=True)
         else:
-            # No cookies, just navigate to LinkedIn
+            # No cookies to normalize, just navigate to LinkedIn
             try:
                 if self.page.is_closed():
                     self.page = await self.context.new_page()
-                await self.page.goto("https://www.linkedin.com", wait_until="domcontentloaded", timeout=30000)
-                await asyncio.sleep(1)
+                await self.page.goto("https://www.linkedin.com", wait_until="commit", timeout=self._timeout)
             except Exception as e:
-                print(f"Warning: Could not navigate to LinkedIn: {e}")
+                logger.warning("Could not navigate to LinkedIn: %s", e)
                 # Try to recreate page
                 if self.page.is_closed() or 'TargetClosedError' in str(type(e)):
                     try:
                         self.page = await self.context.new_page()
-                        timeout = self.config.get('scraping', {}).get('timeout', 30000)
-                        await self.page.goto("https://www.linkedin.com", wait_until="domcontentloaded", timeout=timeout)
+                        await self.page.goto("https://www.linkedin.com", wait_until="commit", timeout=self._timeout)
                     except Exception as retry_error:
-                        print(f"Warning: Could not recover: {retry_error}")
+                        logger.warning("Could not recover: %s", retry_error)
+    
+    async def _acquire_browser(self):
+        """
+        Take a reference to the shared browser, launching it if no scraper holds one.
+        
+        The browser is launched with the headless and block_resources settings
+        of the first scraper that starts it.
+        """
+        cls = LinkedInScraper
+        if cls._browser_lock is None:
+            cls._browser_lock = asyncio.Lock()
+        
+        async with cls._browser_lock:
+            if cls._browser is None:
+                args = list(BROWSER_ARGS)
+                if self._block_resources:
+                    # Never decode images, on top of the request blocking in each context
+                    args.append('--blink-settings=imagesEnabled=false')
+                cls._playwright = await async_playwright().start()
+                cls._browser = await cls._playwright.chromium.launch(
+                    headless=self._headless,
+                    args=args
+                )
+            cls._refcount += 1
+        
+        self.playwright = cls._playwright
+        self.browser = cls._browser
+    
+    async def _release_browser(self):
+        """Drop this scraper's reference to the shared browser, closing it after the last one."""
+        cls = LinkedInScraper
+        self.playwright = None
+        self.browser = None
+        
+        cls._refcount -= 1
+        if cls._refcount > 0:
+            return
+        
+        browser, playwright = cls._browser, cls._playwright
+        cls._browser = None
+        cls._playwright = None
+        cls._browser_lock = None
+        cls._refcount = 0
+        try:
+            if browser:
+                await browser.close()
+            if playwright:
+                await playwright.stop()
+        except Exception as e:
+            logger.warning("Error closing browser: %s", e)
+    
+    def _load_session_state(self) -> Optional[Dict]:
+        """
+        Load the session state saved by a previous run.
+        
+        Returns:
+            The storage state dictionary, or None if there is no state file or
+            cookies_file has been updated since it was written
+        """
+        if not os.path.exists(self.state_file):
+            return None
+        
+        if (os.path.exists(self.cookies_file)
+                and os.path.getmtime(self.cookies_file) > os.path.getmtime(self.state_file)):
+            return None
+        
+        try:
+            with open(self.state_file, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning("Could not load session state: %s", e)
+            return None
+    
+    async def _save_session_state(self):
+        """Save the context's storage state so later runs can skip cookie normalization."""
+        try:
+            await self.context.storage_state(path=self.state_file)
+        except Exception as e:
+            logger.warning("Could not save session state: %s", e)
+    
+    async def _launch_context(self, storage_state: Optional[Dict] = None):
+        """
+        Open a fresh context with its main page in the shared browser.
+        
+        Args:
+            storage_state: Optional Playwright storage state loaded into the new
+                context (a saved session or the state of a context being rotated)
+        """
+        # The login session comes from storage_state rather than an on-disk
+        # browser profile, so every context starts from a clean slate
+        self.context = await self.browser.new_context(
+            storage_state=storage_state,
+            viewport={"width": 1920, "height": 1080},
+            user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            locale='en-US',
+            extra_http_headers={
+                'Accept-Language': 'en-US,en;q=0.9',
+            },
+        )
+        self.page = await self.context.new_page()
+        
+        # Add script to hide webdriver property
+        try:
+            await self.context.add_init_script("""
+                Object.defineProperty(navigator, 'webdriver', {
+                    get: () => undefined
+                });
+            """)
+        except Exception as e:
+            logger.warning("Could not add init script: %s", e)
+        
+        # Skip images, media, fonts and ad/analytics requests to cut page weight
+        if self._block_resources:
+            try:
+                await self.context.route("**/*", self._route_request)
+            except Exception as e:
+                logger.warning("Could not enable resource blocking: %s", e)
+        
+        # Search tabs for this context, opened up front and reused
+        self._page_pool = asyncio.Queue()
+        pages = await asyncio.gather(*(self.context.new_page() for _ in range(max(1, self._max_concurrency))))
+        for page in pages:
+            self._page_pool.put_nowait(page)
+        
+        self._nav_count = 0
+    
+    @asynccontextmanager
+    async def _acquire_page(self):
+        """
+        Borrow a search tab from the page pool, returning it when done.
+        
+        A tab that was closed while borrowed is replaced with a new one.
+        """
+        page = await self._page_pool.get()
+        try:
+            yield page
+        finally:
+            if page.is_closed():
+                page = await self.context.new_page()
+            self._page_pool.put_nowait(page)
+    
+    async def _rotate_context(self):
+        """
+        Replace the browser context with a fresh one, keeping the login session.
+        
+        Playwright only releases a context's memory when the context is
+        closed, so long crawls rotate it every rotate_context_every
+        navigations.
+        """
+        logger.info("Rotating browser context after %s navigations...", self._nav_count)
+        state = None
+        try:
+            state = await self.context.storage_state()
+        except Exception as e:
+            logger.warning("Could not save session state: %s", e)
+        
+        try:
+            await self.context.close()
+        except Exception as e:
+            logger.warning("Error closing browser context: %s", e)
+        
+        await self._launch_context(storage_state=state)
+    
+    async def _goto(self, page: Page, url: str, **kwargs):
+        """Navigate page to url, counting navigations for context rotation."""
+        self._nav_count += 1
+        return await page.goto(url, **kwargs)
+    
+    async def _route_request(self, route):
+        """Abort requests for resources the scraper does not need."""
+        request = route.request
+        if request.resource_type in BLOCKED_RESOURCE_TYPES or _is_blocked_url(request.url):
+            await route.abort()
+        else:
+            await route.continue_()
     
     async def login(self, email: Optional[str] = None, password: Optional[str] = None):
         """
@@ -217,55 +511,54 @@ class LinkedInScraper:
             await self.start_browser()
         
         # Go directly to login page (faster than checking feed)
-        timeout = self.config.get('scraping', {}).get('timeout', 30000)
-        print("Navigating to login page...")
+        logger.info("Navigating to login page...")
         try:
-            await self.page.goto("https://www.linkedin.com/login", wait_until="domcontentloaded", timeout=timeout)
+            await self.page.goto("https://www.linkedin.com/login", wait_until="domcontentloaded", timeout=self._timeout)
             await asyncio.sleep(1)  # Minimal wait
             
             # Check if we got redirected (means already logged in)
             current_url = self.page.url.lower()
             if "feed" in current_url or ("linkedin.com" in current_url and "login" not in current_url):
-                print("Already logged in (redirected from login page)")
+                logger.info("Already logged in (redirected from login page)")
                 return
         except Exception as e:
-            print(f"Warning: Could not navigate to login page: {e}")
+            logger.warning("Could not navigate to login page: %s", e)
             # Try to check current URL
             try:
                 current_url = self.page.url.lower()
                 if "feed" in current_url:
-                    print("Already logged in")
+                    logger.info("Already logged in")
                     return
             except:
                 pass
         
         # If not logged in and credentials provided, attempt login
         if email and password:
-            print("Attempting to login with credentials...")
+            logger.info("Attempting to login with credentials...")
             try:
                 # Make sure we're on login page
                 if "login" not in self.page.url.lower():
-                    await self.page.goto("https://www.linkedin.com/login", wait_until="domcontentloaded", timeout=timeout)
-                    await asyncio.sleep(1)
+                    await self.page.goto("https://www.linkedin.com/login", wait_until="commit", timeout=self._timeout)
                 
+                # fill() waits for the inputs itself, no extra delay needed
                 await self.page.fill('input[name="session_key"]', email)
                 await self.page.fill('input[name="session_password"]', password)
                 await self.page.click('button[type="submit"]')
                 
                 # Wait for navigation (use commit for faster response)
-                await self.page.wait_for_load_state("domcontentloaded", timeout=timeout)
+                await self.page.wait_for_load_state("domcontentloaded", timeout=self._timeout)
                 await asyncio.sleep(2)  # Reduced from 3
                 
                 # Save cookies after successful login
                 cookies = await self.page.context.cookies()
                 with open(self.cookies_file, 'w') as f:
                     json.dump(cookies, f, indent=2)
-                print("Login successful, cookies saved")
+                logger.info("Login successful, cookies saved")
             except Exception as e:
-                print(f"ERROR: Login failed: {e}")
+                logger.error("Login failed: %s", e)
                 raise
         else:
-            print("WARNING: No credentials provided. Please login manually in the browser or provide cookies.json")
+            logger.warning("No credentials provided. Please login manually in the browser or provide cookies.json")
     
     async def search_posts(self, keywords: List[str], hashtags: List[str] = None, max_posts: int = None) -> List[Dict]:
         """
@@ -285,51 +578,119 @@ class LinkedInScraper:
         
         all_posts = []
         hashtags = hashtags or []
+        self._seen_urls.clear()
         
         # Get max_posts from config if not provided
         if max_posts is None:
-            max_posts = self.config.get('scraping', {}).get('max_posts_per_search', 50)
+            max_posts = self._max_posts
+        
+        # Stop searching once max_total_posts unique posts have been extracted
+        max_total = self._max_total_posts
+        
+        def cap_reached() -> bool:
+            return bool(max_total) and len(self._seen_urls) >= max_total
         
         # Combine keywords and hashtags for search
         search_terms = keywords + hashtags
         
         # Avoid division by zero
         if not search_terms:
-            print("No search terms provided")
+            logger.info("No search terms provided")
             return []
         
-        print(f"\nSearching for posts with {len(keywords)} keywords and {len(hashtags)} hashtags...")
-        print(f"   Keywords: {', '.join(keywords)}")
+        logger.info("Searching for posts with %d keywords and %d hashtags...", len(keywords), len(hashtags))
+        logger.info("Keywords: %s", ', '.join(keywords))
         if hashtags:
-            print(f"   Hashtags: {', '.join(hashtags)}")
+            logger.info("Hashtags: %s", ', '.join(hashtags))
+        
+        # Method 1 (the feed, on the main page) runs in the background while
+        # the Method 2 searches below use their own tabs
+        feed_task = asyncio.create_task(self._search_feed())
+        
+        # Method 2: Search using LinkedIn search for each keyword/hashtag.
+        # A small pool of workers pulls terms from a queue; each search
+        # borrows a tab from the context's page pool.
+        num_workers = max(1, min(self._max_concurrency, len(search_terms)))
+        logger.info("Method 2: Searching LinkedIn for %d terms (%s at a time)...", len(search_terms), num_workers)
+        
+        term_queue: asyncio.Queue = asyncio.Queue()
+        for i, term in enumerate(search_terms, 1):
+            term_queue.put_nowait((i, term))
         
-        # Method 1: Search the feed for posts containing keywords
+        def rotation_due() -> bool:
+            return bool(self._rotate_every) and self._nav_count >= self._rotate_every
+        
+        async def search_worker() -> List[Dict]:
+            found = []
+            # Stop taking terms once the context is due for rotation or
+            # enough posts have been collected
+            while not term_queue.empty() and not rotation_due() and not cap_reached():
+                i, term = term_queue.get_nowait()
+                logger.info("[%s/%d] Searching for '%s'...", i, len(search_terms), term)
+                try:
+                    async with self._acquire_page() as page:
+                        found.extend(await self.search_term(term, page))
+                except Exception as e:
+                    logger.warning("Error searching for '%s': %s", term, e)
+            return found
+        
+        # Run workers in rounds; between rounds no tabs are borrowed, so the
+        # context (and its page pool) can be rotated safely
+        while not term_queue.empty() and not cap_reached():
+            if rotation_due():
+                # Rotation closes the main page, so let the feed search finish first
+                await asyncio.wait([feed_task])
+                await self._rotate_context()
+            
+            results = await asyncio.gather(*(search_worker() for _ in range(num_workers)), return_exceptions=True)
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.warning("Search worker failed: %s", result)
+                    continue
+                all_posts.extend(result)
+        
+        # Feed posts go first, as when the feed was searched before Method 2
+        all_posts[:0] = await feed_task
+        
+        # Duplicates were already dropped as posts were extracted
+        logger.info("Total unique posts found: %d", len(all_posts))
+        unique_posts = all_posts
+        
+        # Apply max_total_posts limit if configured (optional safety limit)
+        if max_total and len(unique_posts) > max_total:
+            logger.warning("Limiting to %s posts (max_total_posts setting)", max_total)
+            unique_posts = unique_posts[:max_total]
+        else:
+            logger.info("Returning %d unique posts", len(unique_posts))
+        
+        return unique_posts
+    
+    async def _search_feed(self) -> List[Dict]:
+        """
+        Method 1: collect posts from the LinkedIn feed on the main page.
+        
+        Returns:
+            List of post dictionaries (empty if the feed could not be searched)
+        """
         try:
-            print("\nMethod 1: Searching LinkedIn feed...")
-            timeout = self.config.get('scraping', {}).get('timeout', 30000)
+            logger.info("Method 1: Searching LinkedIn feed...")
             try:
-                await self.page.goto("https://www.linkedin.com/feed/", wait_until="commit", timeout=timeout)
-                await asyncio.sleep(5)  # Wait for feed to load
+                await self._goto(self.page, "https://www.linkedin.com/feed/", wait_until="commit", timeout=self._timeout)
             except Exception as nav_error:
-                print(f"   WARNING: Navigation error: {nav_error}")
-                await asyncio.sleep(5)
+                logger.warning("Navigation error: %s", nav_error)
                 # Check if we're already on the feed
                 try:
                     current_url = self.page.url.lower()
                     if "feed" not in current_url:
-                        print("   Trying to navigate again...")
-                        timeout = self.config.get('scraping', {}).get('timeout', 30000)
-                        await self.page.goto("https://www.linkedin.com/feed/", wait_until="commit", timeout=timeout)
-                        await asyncio.sleep(5)
+                        logger.info("Trying to navigate again...")
+                        await self._goto(self.page, "https://www.linkedin.com/feed/", wait_until="commit", timeout=self._timeout)
                 except Exception:
                     pass
             
-            await asyncio.sleep(3)
-            
             # Check if page is still valid
             try:
                 if self.page.is_closed():
-                    print("   WARNING: Page was closed, getting new page...")
+                    logger.warning("Page was closed, getting new page...")
                     if self.context and len(self.context.pages) > 0:
                         self.page = self.context.pages[0]
                     else:
@@ -337,346 +698,244 @@ class LinkedInScraper:
             except Exception:
                 pass
             
+            # Proceed as soon as the first post is rendered
+            await self._wait_for_posts(self.page, self._timeout)
+            
             # Scroll to load more posts
-            print("   Scrolling to load posts...")
+            logger.debug("Scrolling to load posts...")
             try:
-                await self._scroll_and_load_posts(5)  # Scroll 5 times
+                await self._scroll_and_load_posts(MAX_POSTS_PER_PAGE, max_scrolls=5)
             except Exception as scroll_error:
-                print(f"   WARNING: Error scrolling: {scroll_error}")
+                logger.warning("Error scrolling: %s", scroll_error)
             
             # Extract posts from feed
             feed_posts = await self._extract_posts_from_page()
-            print(f"   Found {len(feed_posts)} posts in feed")
-            all_posts.extend(feed_posts)
+            logger.info("Found %d posts in feed", len(feed_posts))
+            return feed_posts
         except Exception as e:
-            print(f"   WARNING: Error searching feed: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.warning("Error searching feed: %s", e, exc_info=True)
+            return []
         
-        # Method 2: Search using LinkedIn search for each keyword/hashtag
-        print(f"\nMethod 2: Searching LinkedIn for {len(search_terms)} terms...")
-        for i, term in enumerate(search_terms, 1):
+    
+    async def search_term(self, term: str, page: Optional[Page] = None) -> List[Dict]:
+        """
+        Search LinkedIn for a single keyword or hashtag.
+        
+        Runs in the given tab, so several terms can be searched concurrently
+        in different tabs. If no tab is given, a new one is opened for the
+        search and closed when it finishes.
+        
+        Args:
+            term: Keyword or hashtag to search for
+            page: Browser tab to search in (optional)
+            
+        Returns:
+            List of post dictionaries found for the term
+        """
+        own_page = page is None
+        if own_page:
+            page = await self.context.new_page()
+        try:
+            # Navigate to LinkedIn search
+            search_url = SEARCH_URL_TMPL.format(quote(term, safe=''))
             try:
-                print(f"\n   [{i}/{len(search_terms)}] Searching for '{term}'...")
-                
-                # Check if page is still valid
+                await self._goto(page, search_url, wait_until="commit", timeout=self._timeout)
+            except Exception as nav_error:
+                logger.warning("Navigation error: %s", nav_error)
                 try:
-                    if self.page.is_closed():
-                        print(f"   ⚠️  Page was closed, getting new page...")
-                        if self.context and len(self.context.pages) > 0:
-                            self.page = self.context.pages[0]
-                        else:
-                            self.page = await self.context.new_page()
+                    await self._goto(page, search_url, wait_until="commit", timeout=self._timeout)
                 except Exception:
-                    pass
-                
-                # Navigate to LinkedIn search
-                search_url = f"https://www.linkedin.com/search/results/content/?keywords={term.replace('#', '%23')}"
-                timeout = self.config.get('scraping', {}).get('timeout', 30000)
-                try:
-                    await self.page.goto(search_url, wait_until="commit", timeout=timeout)
-                    await asyncio.sleep(3)  # Wait for search results to load
-                except Exception as nav_error:
-                    print(f"   WARNING: Navigation error: {nav_error}")
-                    try:
-                        await self.page.goto(search_url, wait_until="commit", timeout=timeout)
-                        await asyncio.sleep(3)
-                    except Exception:
-                        print(f"   WARNING: Could not navigate to search page for '{term}', skipping...")
-                        continue
-                
-                await asyncio.sleep(3)
-                
-                # Scroll to load more posts
-                print(f"   Scrolling to load posts for '{term}'...")
+                    logger.warning("Could not navigate to search page for '%s', skipping...", term)
+                    return []
+            
+            # Proceed as soon as the first search result is rendered
+            await self._wait_for_posts(page, self._timeout)
+            
+            # Scroll to load more posts
+            logger.debug("Scrolling to load posts for '%s'...", term)
+            try:
+                await self._scroll_and_load_posts(MAX_POSTS_PER_PAGE, page, max_scrolls=3)
+            except Exception as scroll_error:
+                logger.warning("Error scrolling: %s", scroll_error)
+            
+            # Extract posts from the search results page
+            posts = await self._extract_posts_from_page(page)
+            logger.info("Found %d posts for '%s'", len(posts), term)
+            
+            # Add delay between requests (from config)
+            logger.debug("Waiting %s seconds before next search...", self._delay)
+            await asyncio.sleep(self._delay)
+            
+            return posts
+        finally:
+            if own_page:
                 try:
-                    await self._scroll_and_load_posts(3)
-                except Exception as scroll_error:
-                    print(f"   WARNING: Error scrolling: {scroll_error}")
-                
-                # Extract posts from current page
-                posts = await self._extract_posts_from_page()
-                print(f"   Found {len(posts)} posts for '{term}'")
-                all_posts.extend(posts)
-                
-                # Add delay between requests (from config)
-                delay = self.config.get('scraping', {}).get('delay_between_requests', 2)
-                print(f"   Waiting {delay} seconds before next search...")
-                await asyncio.sleep(delay)
-                
-            except Exception as e:
-                print(f"   WARNING: Error searching for '{term}': {e}")
-                import traceback
-                traceback.print_exc()
-                continue
-        
-        print(f"\nTotal posts found: {len(all_posts)}")
-        
-        # Debug: Check post_urls before deduplication
-        posts_with_url = sum(1 for p in all_posts if p.get('post_url'))
-        posts_without_url = len(all_posts) - posts_with_url
-        if posts_without_url > 0:
-            print(f"   WARNING: {posts_without_url} posts missing post_url (will use text hash for deduplication)")
-        
-        # Remove duplicates
+                    await page.close()
+                except Exception:
+                    pass
+    
+    async def _wait_for_posts(self, page: Page, timeout: int):
+        """Wait until the first post is attached to the page (gives up quietly on timeout)."""
         try:
-            from utils import deduplicate_posts
-            unique_posts = deduplicate_posts(all_posts, key='post_url')
-            print(f"   After deduplication: {len(unique_posts)} unique posts")
-        except ImportError:
-            # Fallback if utils module not available
-            import hashlib
-            seen_urls = set()
-            unique_posts = []
-            for post in all_posts:
-                post_url = post.get('post_url')
-                # If no post_url, use text hash
-                if not post_url:
-                    text = post.get('text', '')
-                    if text:
-                        post_url = hashlib.md5(text.encode()).hexdigest()
-                    else:
-                        post_url = f"post_{len(unique_posts)}"
-                
-                if post_url not in seen_urls:
-                    seen_urls.add(post_url)
-                    unique_posts.append(post)
+            # A locator wait returns no ElementHandle, so nothing is left for
+            # Playwright to track after the wait
+            await page.locator(POSTS_READY_SELECTOR).first.wait_for(state="attached", timeout=timeout)
+        except PlaywrightTimeoutError:
+            logger.warning("Timed out waiting for posts to appear")
+    
+    async def _scroll_and_load_posts(self, target_total: int, page: Optional[Page] = None, max_scrolls: int = 10):
+        """
+        Scroll page (defaults to the main page) to load more posts dynamically.
         
-        # Apply max_total_posts limit if configured (optional safety limit)
-        max_total = self.config.get('scraping', {}).get('max_total_posts')
-        if max_total and len(unique_posts) > max_total:
-            print(f"   WARNING: Limiting to {max_total} posts (max_total_posts setting)")
-            unique_posts = unique_posts[:max_total]
-        else:
-            print(f"   Returning {len(unique_posts)} unique posts")
+        No scroll is made once target_total posts are rendered, and scrolling
+        stops as soon as a scroll loads no new posts or leaves the page height
+        unchanged, so pages that have run out of content don't cost the
+        remaining scroll pauses.
         
-        return unique_posts
-    
-    async def _scroll_and_load_posts(self, target_count: int):
-        """Scroll page to load more posts dynamically."""
+        Args:
+            target_total: Stop once this many posts are rendered in total
+            page: Page to scroll
+            max_scrolls: Upper bound on the number of scrolls
+        """
+        page = page or self.page
         try:
-            scroll_pause = 1
             # Check if page is still valid
-            if self.page.is_closed():
+            if page.is_closed():
                 return
             
-            last_height = await self.page.evaluate("document.body.scrollHeight")
-            scroll_count = 0
-            max_scrolls = target_count if target_count > 0 else 10
-            
-            while scroll_count < max_scrolls:
-                # Check if page is still valid before scrolling
-                try:
-                    if self.page.is_closed():
-                        break
-                    
-                    # Scroll down
-                    await self.page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                    await asyncio.sleep(scroll_pause)
-                    
-                    # Check if new content loaded
-                    new_height = await self.page.evaluate("document.body.scrollHeight")
-                    if new_height == last_height:
-                        break
-                    
-                    last_height = new_height
-                    scroll_count += 1
-                except Exception as scroll_error:
-                    # If page closed or error, stop scrolling
-                    break
+            # The whole scroll loop runs in the browser, in a single round-trip
+            await page.evaluate(SCROLL_TO_LOAD_JS, [POSTS_READY_SELECTOR, target_total, max_scrolls, SCROLL_PAUSE_MS])
         except Exception as e:
-            print(f"   WARNING: Error in scroll function: {e}")
+            logger.warning("Error in scroll function: %s", e)
     
-    async def _extract_posts_from_page(self) -> List[Dict]:
-        """Extract post data from the current page."""
+    async def _extract_posts_from_page(self, page: Optional[Page] = None) -> List[Dict]:
+        """Extract post data from the given page (defaults to the main page)."""
+        page = page or self.page
         posts = []
         
         try:
-            # Wait a bit for page to load
-            await asyncio.sleep(2)
-            
-            # Try multiple selectors for LinkedIn posts
-            post_selectors = [
-                'div[data-id*="urn:li:activity"]',
-                'div.feed-shared-update-v2',
-                'article.feed-shared-update-v2',
-                'div[data-urn*="urn:li:activity"]',
-                'div.update-components-actor',
-            ]
-            
-            post_elements = []
-            for selector in post_selectors:
+            # Wait (bounded by one timeout) for whichever post selector appears
+            # first; a miss means the fallback selector below is used
+            try:
+                await page.locator(POST_SELECTORS_JOINED).first.wait_for(state="attached", timeout=5000)
+            except PlaywrightTimeoutError:
+                pass
+            
+            # Raw fields for every post are read in the browser with a single
+            # evaluate call per page instead of ~10 round-trips per post.
+            # Selectors are tried in order of preference without further waits.
+            raw_posts = []
+            for selector in POST_SELECTORS:
                 try:
-                    await self.page.wait_for_selector(selector, timeout=5000)
-                    elements = await self.page.query_selector_all(selector)
-                    if elements:
-                        print(f"Found {len(elements)} posts using selector: {selector}")
-                        post_elements = elements
+                    raw_posts = await page.eval_on_selector_all(selector, EXTRACT_POSTS_JS, MAX_POSTS_PER_PAGE)
+                    if raw_posts:
+                        logger.debug("Found %d posts using selector: %s", len(raw_posts), selector)
                         break
                 except Exception:
                     continue
             
-            if not post_elements:
-                print("WARNING: No posts found with any selector. Trying to find any post-like elements...")
-                # Try to find any divs that might be posts
-                all_divs = await self.page.query_selector_all('div')
-                print(f"Found {len(all_divs)} divs on page")
-                # Look for divs with specific classes or attributes
-                for div in all_divs[:50]:  # Check first 50 divs
-                    try:
-                        class_name = await div.get_attribute('class')
-                        if class_name and ('feed' in class_name.lower() or 'update' in class_name.lower() or 'post' in class_name.lower()):
-                            post_elements.append(div)
-                    except Exception:
-                        continue
-                print(f"Found {len(post_elements)} potential post elements")
+            if not raw_posts:
+                logger.warning("No posts found with any selector. Trying to find any post-like elements...")
+                # Any div whose class mentions feed/update/post, matched by the
+                # browser's selector engine in a single query
+                raw_posts = await page.eval_on_selector_all(FALLBACK_POST_SELECTOR, EXTRACT_POSTS_JS, MAX_POSTS_PER_PAGE)
+                logger.info("Found %d potential post elements", len(raw_posts))
             
-            for element in post_elements[:20]:  # Limit to first 20 posts per page
-                try:
-                    post_data = await self._extract_single_post(element)
-                    if post_data:
-                        posts.append(post_data)
-                        print(f"  Extracted post: {post_data.get('author_name', 'Unknown')} - {post_data.get('text_snippet', '')[:50]}...")
-                except Exception as e:
-                    # Don't print every error, just continue
-                    continue
+            # Posts are built synchronously from the raw fields (no awaits per
+            # post), all against the same reference time
+            now = datetime.now()
+            for raw_post in raw_posts:
+                post_data = self._extract_single_post(raw_post, now)
+                if post_data:
+                    # Drop posts already seen on an earlier page or search
+                    post_key = post_data['post_url']
+                    if post_key in self._seen_urls:
+                        continue
+                    self._seen_urls.add(post_key)
+                    posts.append(post_data)
+                    logger.debug("Extracted post: %s - %.50s...", post_data['author_name'], post_data.get('text_snippet', ''))
         
         except PlaywrightTimeoutError:
-            print("WARNING: Timeout waiting for posts to load")
+            logger.warning("Timeout waiting for posts to load")
         except Exception as e:
-            print(f"WARNING: Error extracting posts: {e}")
+            logger.warning("Error extracting posts: %s", e)
         
         return posts
     
-    async def _extract_single_post(self, element) -> Optional[Dict]:
-        """Extract data from a single post element."""
+    def _extract_single_post(self, raw_post: Dict, now: Optional[datetime] = None) -> Optional[Dict]:
+        """
+        Build a post dictionary from the raw fields read by EXTRACT_POSTS_JS.
+        
+        Args:
+            raw_post: Raw fields of one post element
+            now: Reference time for relative and missing dates (defaults to datetime.now())
+            
+        Returns:
+            Post dictionary, or None if the element has neither a link nor text
+        """
+        if now is None:
+            now = datetime.now()
+        
         try:
-            # Extract post URL
-            post_link = await element.query_selector('a[href*="/posts/"]')
-            post_url = None
-            if post_link:
-                href = await post_link.get_attribute('href')
-                if href:
-                    post_url = href if href.startswith('http') else f"https://www.linkedin.com{href}"
+            post_url = raw_post.get('post_url')
             
             # Extract author info
-            author_link = await element.query_selector('a[href*="/in/"]')
-            author_url = None
+            author_url = raw_post.get('author_url')
             author_name = None
-            if author_link:
-                href = await author_link.get_attribute('href')
-                if href:
-                    author_url = href if href.startswith('http') else f"https://www.linkedin.com{href}"
-                    author_name = await author_link.inner_text()
-                    author_name = author_name.strip() if author_name else None
-            
-            # Extract post text
-            text_selectors = [
-                'div.feed-shared-update-v2__description',
-                'span[dir="ltr"]',
-                'div.feed-shared-text-view'
-            ]
-            
-            text = ""
-            for selector in text_selectors:
-                text_elem = await element.query_selector(selector)
-                if text_elem:
-                    text = await text_elem.inner_text()
-                    if text:
-                        break
+            if author_url:
+                author_name = (raw_post.get('author_name') or '').strip() or None
+            
+            raw_text = raw_post.get('text') or ''
+            text = raw_text.strip()
             
             # Extract date
-            time_elem = await element.query_selector('time')
             date_posted = None
-            if time_elem:
-                datetime_attr = await time_elem.get_attribute('datetime')
-                if datetime_attr:
-                    try:
-                        date_posted = datetime.fromisoformat(datetime_attr.replace('Z', '+00:00'))
-                    except (ValueError, AttributeError):
-                        pass
-                
-                # Fallback to relative date parsing
-                if not date_posted:
-                    date_text = await time_elem.inner_text()
-                    if date_text:
-                        try:
-                            from parser import parse_relative_date
-                            date_posted = parse_relative_date(date_text)
-                        except ImportError:
-                            pass
-            
-            # Extract engagement metrics
-            likes = 0
-            comments = 0
-            
-            # Try to find likes
-            likes_elem = await element.query_selector('button[aria-label*="like"], span[class*="reactions"]')
-            if likes_elem:
-                likes_text = await likes_elem.inner_text()
-                if likes_text:
-                    import re
-                    numbers = re.findall(r'\d+', likes_text.replace(',', ''))
-                    if numbers:
-                        likes = int(numbers[0])
-            
-            # Try to find comments
-            comments_elem = await element.query_selector('button[aria-label*="comment"], span[class*="comments"]')
-            if comments_elem:
-                comments_text = await comments_elem.inner_text()
-                if comments_text:
-                    import re
-                    numbers = re.findall(r'\d+', comments_text.replace(',', ''))
-                    if numbers:
-                        comments = int(numbers[0])
-            
-            # If we don't have post_url, try to construct it from other data
-            if not post_url:
-                # Try to find any link in the post
-                any_link = await element.query_selector('a[href]')
-                if any_link:
-                    href = await any_link.get_attribute('href')
-                    if href and '/posts/' in href:
-                        post_url = href if href.startswith('http') else f"https://www.linkedin.com{href}"
-            
-            # If we still don't have text, try to get any text from the element
-            if not text:
+            datetime_attr = raw_post.get('datetime')
+            if datetime_attr:
                 try:
-                    text = await element.inner_text()
-                    text = text.strip() if text else ""
-                except Exception:
+                    date_posted = datetime.fromisoformat(datetime_attr if _NATIVE_Z else datetime_attr.replace('Z', '+00:00'))
+                except (ValueError, AttributeError):
                     pass
             
+            # Fallback to relative date parsing
+            if not date_posted and raw_post.get('date_text'):
+                date_posted = parse_relative_date(raw_post['date_text'], now)
+            
+            # Extract engagement metrics
+            likes_text = raw_post.get('likes_text')
+            likes = _parse_count(likes_text) if likes_text else 0
+            
+            comments_text = raw_post.get('comments_text')
+            comments = _parse_count(comments_text) if comments_text else 0
+            
             # Only skip if we have absolutely no data
             if not post_url and not text:
                 return None
             
-            # If no post_url, create a hash-based one from text
-            if not post_url:
-                import hashlib
-                text_hash = hashlib.md5(text.encode()).hexdigest()[:12]
-                post_url = f"https://www.linkedin.com/feed/post/{text_hash}"
-            
             post_data = {
                 'post_url': post_url or '',
                 'author_url': author_url or '',
                 'author_name': author_name or 'Unknown',
-                'text': text.strip(),
-                'date_posted': date_posted or datetime.now(),
+                'text': text,
+                'date_posted': date_posted or now,
                 'likes': likes,
                 'comments': comments
             }
             
-            # Clean post data
+            # Clean post data (also makes relative hrefs absolute)
             try:
                 post_data = clean_post_data(post_data)
             except Exception as e:
-                print(f"Warning: Could not clean post data: {e}")
+                logger.warning("Could not clean post data: %s", e)
+            
+            # If no post_url, create a hash-based one from the text as extracted
+            if not post_data['post_url']:
+                post_data['post_url'] = fallback_post_url(raw_text)
             
             return post_data
         
         except Exception as e:
-            print(f"Error extracting single post: {e}")
+            logger.error("Error extracting single post: %s", e)
             return None
     
     async def scrape(self, keywords: List[str] = None, hashtags: List[str] = None) -> List[Dict]:
@@ -692,25 +951,25 @@ class LinkedInScraper:
         """
         keywords = keywords or self.config.get('keywords', [])
         hashtags = hashtags or self.config.get('hashtags', [])
-        max_posts = self.config.get('scraping', {}).get('max_posts_per_search', 50)
+        max_posts = self._max_posts
         
         await self.start_browser()
         
         # Ensure page is still valid, recreate if needed
         try:
             if not self.page or self.page.is_closed():
-                print("Page was closed, recreating...")
+                logger.info("Page was closed, recreating...")
                 if self.context:
-                    # With persistent context, get existing page or create new one
+                    # Get existing page or create new one
                     if len(self.context.pages) > 0:
                         self.page = self.context.pages[0]
                     else:
                         self.page = await self.context.new_page()
                 else:
-                    print("Error: Browser context is not available.")
+                    logger.error("Browser context is not available.")
                     return []
         except Exception as e:
-            print(f"Error checking page status: {e}")
+            logger.error("Error checking page status: %s", e)
             # Try to get a page from context
             try:
                 if self.context and len(self.context.pages) > 0:
@@ -720,7 +979,7 @@ class LinkedInScraper:
                 else:
                     return []
             except Exception as recreate_error:
-                print(f"Error: Could not recreate page: {recreate_error}")
+                logger.error("Could not recreate page: %s", recreate_error)
                 return []
         
         # Quick login check - go directly to login page, check if redirected
@@ -731,93 +990,87 @@ class LinkedInScraper:
                 elif self.context:
                     self.page = await self.context.new_page()
             
-            print("Checking login status...")
-            timeout = self.config.get('scraping', {}).get('timeout', 30000)
+            logger.info("Checking login status...")
             
             # Go directly to login page (faster than feed)
             # If logged in, LinkedIn will redirect us
             try:
-                await self.page.goto("https://www.linkedin.com/login", wait_until="domcontentloaded", timeout=timeout)
+                await self.page.goto("https://www.linkedin.com/login", wait_until="domcontentloaded", timeout=self._timeout)
                 await asyncio.sleep(1)  # Minimal wait
                 
                 # Check if redirected (means logged in)
                 current_url = self.page.url.lower()
                 if "login" not in current_url:
-                    print("Already logged in (redirected from login page)")
+                    logger.info("Already logged in (redirected from login page)")
                 else:
-                    print("WARNING: Not logged in - please login manually in the browser")
+                    logger.warning("Not logged in - please login manually in the browser")
             except Exception as nav_error:
                 # If navigation fails, try to check current URL
                 try:
                     current_url = self.page.url.lower()
                     if "feed" in current_url or ("linkedin.com" in current_url and "login" not in current_url):
-                        print("Already logged in")
+                        logger.info("Already logged in")
                     else:
-                        print(f"WARNING: Navigation error: {nav_error}")
+                        logger.warning("Navigation error: %s", nav_error)
                 except:
-                    print(f"WARNING: Could not determine login status: {nav_error}")
+                    logger.warning("Could not determine login status: %s", nav_error)
             
             # Login check complete - proceed with scraping
                 
         except Exception as e:
-            print(f"WARNING: Error navigating to LinkedIn feed: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.warning("Error navigating to LinkedIn feed: %s", e, exc_info=True)
             # Try to get page from context if it was closed
             if 'TargetClosedError' in str(type(e)) or 'TargetClosed' in str(e):
                 try:
-                    print("Attempting to get page from context...")
+                    logger.info("Attempting to get page from context...")
                     if self.context and len(self.context.pages) > 0:
                         self.page = self.context.pages[0]
                         try:
-                            timeout = self.config.get('scraping', {}).get('timeout', 30000)
-                            await self.page.goto("https://www.linkedin.com/feed/", wait_until="domcontentloaded", timeout=timeout)
+                            await self.page.goto("https://www.linkedin.com/feed/", wait_until="domcontentloaded", timeout=self._timeout)
                         except Exception:
-                            timeout = self.config.get('scraping', {}).get('timeout', 30000)
-                            await self.page.goto("https://www.linkedin.com/feed/", wait_until="load", timeout=timeout)
+                            await self.page.goto("https://www.linkedin.com/feed/", wait_until="load", timeout=self._timeout)
                         await asyncio.sleep(3)
                         current_url = self.page.url.lower()
                         if "login" in current_url or "challenge" in current_url:
-                            print("WARNING: Not logged in. Please log in to LinkedIn in the browser window.")
+                            logger.warning("Not logged in. Please log in to LinkedIn in the browser window.")
                             return []
                     else:
                         return []
                 except Exception as retry_error:
-                    print(f"Could not recover from navigation error: {retry_error}")
+                    logger.error("Could not recover from navigation error: %s", retry_error)
                     return []
             else:
                 return []
         
         # Search for posts
         try:
-            print("\nStarting post search...")
+            logger.info("Starting post search...")
             posts = await self.search_posts(keywords, hashtags, max_posts)
-            print(f"Post search completed. Found {len(posts)} posts.")
+            logger.info("Post search completed. Found %d posts.", len(posts))
             return posts
         except Exception as e:
-            print(f"ERROR: Error during post search: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.error("Error during post search: %s", e, exc_info=True)
             return []
     
     async def close(self):
-        """Close browser and cleanup."""
-        # With persistent context, browser is the context, so we only close context
-        # This will save the session data automatically
-        # BUT - don't close if we want to keep the session!
-        # Only close if explicitly needed
-        print("\nSaving browser session...")
-        print("   (Browser window will stay open to preserve your login session)")
-        print("   You can close it manually when done.")
-        
-        # Don't close the context - let user close browser manually to preserve session
-        # This way the login session is saved
-        try:
-            if self.playwright:
-                # Don't stop playwright - let browser stay open
-                pass
-        except Exception:
-            pass
+        """Save the login session, close this scraper's context and storage, and release the shared browser."""
+        if self.context:
+            logger.info("Saving browser session...")
+            await self._save_session_state()
+            try:
+                await self.context.close()
+            except Exception as e:
+                logger.warning("Error closing browser context: %s", e)
+        
+        if self.browser is not None:
+            await self._release_browser()
+        
+        if self._storage is not None:
+            self._storage.close()
+            self._storage = None
+        
+        self.page = None
+        self.context = None
 
 
 async def scrape_linkedin(config: dict, keywords: List[str] = None, hashtags: List[str] = None) -> List[Dict]:
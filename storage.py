@@ -1,12 +1,47 @@
 """
 Storage module for saving posts to CSV and SQLite database.
 """
+import atexit
 import csv
 import sqlite3
 import os
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Set, TextIO
 import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+# CSV columns, in the order rows are written
+CSV_COLUMNS = ('date', 'author', 'author_url', 'post_url', 'text_snippet', 'score', 'likes', 'comments')
+
+# Statement kept as a constant so every call hits SQLite's statement cache
+INSERT_POST_SQL = '''
+    INSERT OR REPLACE INTO posts
+    (date, author, author_url, post_url, text_snippet, full_text, score, likes, comments)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+# Log files opened by write_log, kept open by path
+_log_files: Dict[str, TextIO] = {}
+
+
+def _format_date(date_posted, default: str = '') -> str:
+    """
+    Format a post's date_posted value for storage.
+    
+    Args:
+        date_posted: datetime object or already formatted date string
+        default: Value used when date_posted is missing, formatted once by the caller
+        
+    Returns:
+        Date as YYYY-MM-DD for datetimes, otherwise the value as a string
+    """
+    if isinstance(date_posted, datetime):
+        # Same output as strftime('%Y-%m-%d') without the format parsing
+        return date_posted.date().isoformat()
+    return str(date_posted) if date_posted else default
 
 
 class StorageManager:
@@ -24,11 +59,18 @@ class StorageManager:
         """
         self.csv_file = csv_file
         self.db_file = db_file
+        # One connection for the manager's lifetime (see close())
+        self._conn = sqlite3.connect(self.db_file)
         self._init_database()
     
     def _init_database(self):
         """Initialize SQLite database with posts table."""
-        conn = sqlite3.connect(self.db_file)
+        conn = self._conn
+        # WAL mode is stored in the database file, so it only needs setting
+        # once; commits then append to the log instead of rewriting pages.
+        # synchronous applies to this (persistent) connection.
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -53,7 +95,10 @@ class StorageManager:
         ''')
         
         conn.commit()
-        conn.close()
+    
+    def close(self):
+        """Close the database connection."""
+        self._conn.close()
     
     def save_posts(self, posts: List[Dict], append: bool = False):
         """
@@ -64,79 +109,83 @@ class StorageManager:
             append: If True, append to existing files; otherwise overwrite
         """
         if not posts:
-            print("No posts to save.")
+            logger.info("No posts to save.")
             return
         
         self._save_to_csv(posts, append)
         self._save_to_db(posts)
-        print(f"Saved {len(posts)} posts to {self.csv_file} and {self.db_file}")
+        logger.info("Saved %d posts to %s and %s", len(posts), self.csv_file, self.db_file)
     
     def _save_to_csv(self, posts: List[Dict], append: bool):
-        """Save posts to CSV file."""
+        """
+        Save posts to CSV file.
+        
+        Rows are streamed as plain tuples into a single writerows call,
+        which avoids DictWriter's per-row dict handling.
+        """
         if not posts:
             return
         
-        # Define CSV columns
-        fieldnames = ['date', 'author', 'author_url', 'post_url', 'text_snippet', 'score', 'likes', 'comments']
-        
         mode = 'a' if append and os.path.exists(self.csv_file) else 'w'
         
+        rows = (
+            (
+                _format_date(post.get('date_posted')),
+                post.get('author_name', ''),
+                post.get('author_url', ''),
+                post.get('post_url', ''),
+                post.get('text_snippet', ''),
+                post.get('score', 0),
+                post.get('likes', 0),
+                post.get('comments', 0)
+            )
+            for post in posts
+        )
+        
         with open(self.csv_file, mode, newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+            writer = csv.writer(csvfile)
             
             if mode == 'w':
-                writer.writeheader()
+                writer.writerow(CSV_COLUMNS)
             
-            for post in posts:
-                row = {
-                    'date': post.get('date_posted', datetime.now()).strftime('%Y-%m-%d') if isinstance(post.get('date_posted'), datetime) else str(post.get('date_posted', '')),
-                    'author': post.get('author_name', ''),
-                    'author_url': post.get('author_url', ''),
-                    'post_url': post.get('post_url', ''),
-                    'text_snippet': post.get('text_snippet', ''),
-                    'score': post.get('score', 0),
-                    'likes': post.get('likes', 0),
-                    'comments': post.get('comments', 0)
-                }
-                writer.writerow(row)
+            writer.writerows(rows)
     
     def _save_to_db(self, posts: List[Dict]):
-        """Save posts to SQLite database."""
-        conn = sqlite3.connect(self.db_file)
-        cursor = conn.cursor()
-        
-        for post in posts:
-            try:
-                date_posted = post.get('date_posted', datetime.now())
-                if isinstance(date_posted, datetime):
-                    date_str = date_posted.strftime('%Y-%m-%d')
-                else:
-                    date_str = str(date_posted)
-                
-                cursor.execute('''
-                    INSERT OR REPLACE INTO posts 
-                    (date, author, author_url, post_url, text_snippet, full_text, score, likes, comments)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    date_str,
-                    post.get('author_name', ''),
-                    post.get('author_url', ''),
-                    post.get('post_url', ''),
-                    post.get('text_snippet', ''),
-                    post.get('text', ''),
-                    post.get('score', 0),
-                    post.get('likes', 0),
-                    post.get('comments', 0)
-                ))
-            except sqlite3.IntegrityError:
-                # Post already exists, skip
-                continue
-            except Exception as e:
-                print(f"Error saving post to database: {e}")
-                continue
-        
-        conn.commit()
-        conn.close()
+        """
+        Save posts to SQLite database.
+
+        All rows are written with one executemany call inside a single
+        transaction, so the database is synced once per save instead of once
+        per post. Rows are generated lazily, so the save never holds a
+        second copy of the posts in memory.
+
+        Args:
+            posts: List of post dictionaries
+        """
+        # Posts without a date are stored under today's date
+        today = datetime.now().date().isoformat()
+        rows = (
+            (
+                _format_date(post.get('date_posted'), today),
+                post.get('author_name', ''),
+                post.get('author_url', ''),
+                post.get('post_url', ''),
+                post.get('text_snippet', ''),
+                post.get('text', ''),
+                post.get('score', 0),
+                post.get('likes', 0),
+                post.get('comments', 0)
+            )
+            for post in posts
+        )
+
+        conn = self._conn
+        try:
+            # One transaction for the whole save; rolled back on error
+            with conn:
+                conn.executemany(INSERT_POST_SQL, rows)
+        except sqlite3.Error as e:
+            logger.error("Error saving posts to database: %s", e)
     
     def get_recent_posts(self, limit: int = 10) -> List[Dict]:
         """
@@ -148,8 +197,7 @@ class StorageManager:
         Returns:
             List of post dictionaries
         """
-        conn = sqlite3.connect(self.db_file)
-        cursor = conn.cursor()
+        cursor = self._conn.cursor()
         
         cursor.execute('''
             SELECT date, author, author_url, post_url, text_snippet, score, likes, comments
@@ -159,7 +207,6 @@ class StorageManager:
         ''', (limit,))
         
         rows = cursor.fetchall()
-        conn.close()
         
         posts = []
         for row in rows:
@@ -186,29 +233,55 @@ class StorageManager:
         Returns:
             True if post exists, False otherwise
         """
-        conn = sqlite3.connect(self.db_file)
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT 1 FROM posts WHERE post_url = ?', (post_url,))
-        exists = cursor.fetchone() is not None
+        return post_url in self.existing_urls([post_url])
+    
+    def existing_urls(self, urls: List[str], chunk_size: int = 500) -> Set[str]:
+        """
+        Find which of the given post URLs are already in the database.
         
-        conn.close()
-        return exists
+        Args:
+            urls: Post URLs to look up
+            chunk_size: URLs per query (kept under SQLite's bound-variable limit)
+            
+        Returns:
+            Set of the URLs that exist
+        """
+        urls = list(urls)
+        found = set()
+        for start in range(0, len(urls), chunk_size):
+            chunk = urls[start:start + chunk_size]
+            placeholders = ','.join('?' * len(chunk))
+            cursor = self._conn.execute(f'SELECT post_url FROM posts WHERE post_url IN ({placeholders})', chunk)
+            found.update(row[0] for row in cursor)
+        return found
 
 
 def write_log(log_file: str, message: str):
     """
     Write a log message to file.
     
+    The file is opened on first use and kept open (line buffered) for later
+    calls; open log files are closed at interpreter exit.
+    
     Args:
         log_file: Path to log file
         message: Log message to write
     """
-    os.makedirs(os.path.dirname(log_file) if os.path.dirname(log_file) else '.', exist_ok=True)
+    f = _log_files.get(log_file)
+    if f is None:
+        os.makedirs(os.path.dirname(log_file) if os.path.dirname(log_file) else '.', exist_ok=True)
+        f = open(log_file, 'a', encoding='utf-8', buffering=1)
+        _log_files[log_file] = f
     
     timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    log_entry = f"[{timestamp}] {message}\n"
-    
-    with open(log_file, 'a', encoding='utf-8') as f:
-        f.write(log_entry)
+    f.write(f"[{timestamp}] {message}\n")
+
+
+def _close_log_files():
+    """Close the log files opened by write_log."""
+    for f in _log_files.values():
+        f.close()
+    _log_files.clear()
+
 
+atexit.register(_close_log_files)
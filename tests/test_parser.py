@@ -0,0 +1,69 @@
+"""
+Tests for date helpers in parser.py.
+"""
+import unittest
+from datetime import datetime
+
+try:
+    from parser import _subtract_months, parse_relative_date
+except ImportError as e:  # BeautifulSoup not installed
+    raise unittest.SkipTest(f"parser dependencies not installed: {e}")
+
+
+class SubtractMonthsTest(unittest.TestCase):
+    def test_same_day_of_month(self):
+        self.assertEqual(_subtract_months(datetime(2024, 1, 15), 1), datetime(2023, 12, 15))
+    
+    def test_clamps_to_end_of_shorter_month(self):
+        self.assertEqual(_subtract_months(datetime(2024, 3, 31), 1), datetime(2024, 2, 29))
+        self.assertEqual(_subtract_months(datetime(2023, 3, 31), 1), datetime(2023, 2, 28))
+    
+    def test_keeps_time_of_day(self):
+        self.assertEqual(_subtract_months(datetime(2024, 5, 31, 10, 30), 3), datetime(2024, 2, 29, 10, 30))
+    
+    def test_whole_years(self):
+        self.assertEqual(_subtract_months(datetime(2024, 12, 31), 12), datetime(2023, 12, 31))
+        self.assertEqual(_subtract_months(datetime(2024, 1, 31), 25), datetime(2021, 12, 31))
+    
+    def test_zero_months(self):
+        self.assertEqual(_subtract_months(datetime(2024, 1, 31), 0), datetime(2024, 1, 31))
+
+
+class ParseRelativeDateTest(unittest.TestCase):
+    # Just after midnight on the first of a month, so small offsets cross
+    # day and month boundaries
+    NOW = datetime(2024, 3, 1, 0, 30)
+    
+    def test_hours_cross_day_and_month_boundary(self):
+        self.assertEqual(parse_relative_date('3 hours ago', self.NOW), datetime(2024, 2, 29, 21, 30))
+        self.assertEqual(parse_relative_date('1 hour ago', self.NOW), datetime(2024, 2, 29, 23, 30))
+    
+    def test_hours_cross_year_boundary(self):
+        self.assertEqual(parse_relative_date('2 hours ago', datetime(2024, 1, 1, 1, 0)), datetime(2023, 12, 31, 23, 0))
+    
+    def test_days_cross_month_boundary(self):
+        self.assertEqual(parse_relative_date('2 days ago', self.NOW), datetime(2024, 2, 28, 0, 30))
+    
+    def test_days_cross_year_boundary(self):
+        self.assertEqual(parse_relative_date('5 days ago', datetime(2024, 1, 3, 8, 0)), datetime(2023, 12, 29, 8, 0))
+    
+    def test_weeks_cross_month_and_year_boundary(self):
+        self.assertEqual(parse_relative_date('1 week ago', self.NOW), datetime(2024, 2, 23, 0, 30))
+        self.assertEqual(parse_relative_date('2 weeks ago', datetime(2024, 1, 3, 8, 0)), datetime(2023, 12, 20, 8, 0))
+    
+    def test_months_use_calendar_months(self):
+        self.assertEqual(parse_relative_date('1 month ago', datetime(2024, 3, 31, 12, 0)), datetime(2024, 2, 29, 12, 0))
+    
+    def test_case_and_whitespace_are_ignored(self):
+        self.assertEqual(parse_relative_date('  3 Hours Ago ', self.NOW), datetime(2024, 2, 29, 21, 30))
+    
+    def test_unmatched_text_returns_now(self):
+        self.assertEqual(parse_relative_date('Just now', self.NOW), self.NOW)
+        self.assertEqual(parse_relative_date('Edited', self.NOW), self.NOW)
+    
+    def test_empty_text_returns_none(self):
+        self.assertIsNone(parse_relative_date('', self.NOW))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+"""
+Tests for engagement count parsing and request blocking in scraper.py.
+"""
+import unittest
+
+try:
+    from scraper import _is_blocked_url, _parse_count
+except ImportError as e:  # Playwright not installed
+    raise unittest.SkipTest(f"scraper dependencies not installed: {e}")
+
+
+class ParseCountTest(unittest.TestCase):
+    def test_plain_numbers(self):
+        self.assertEqual(_parse_count('42'), 42)
+        self.assertEqual(_parse_count('12 comments'), 12)
+    
+    def test_thousands_separators(self):
+        self.assertEqual(_parse_count('1,234 reactions'), 1234)
+    
+    def test_abbreviations(self):
+        self.assertEqual(_parse_count('1.2K'), 1200)
+        self.assertEqual(_parse_count('3k reactions'), 3000)
+        self.assertEqual(_parse_count('2 M'), 2000000)
+    
+    def test_abbreviations_are_rounded_not_truncated(self):
+        self.assertEqual(_parse_count('4.1M'), 4100000)
+        self.assertEqual(_parse_count('8.2M'), 8200000)
+        self.assertEqual(_parse_count('1.1K'), 1100)
+    
+    def test_suffix_must_be_a_whole_word(self):
+        self.assertEqual(_parse_count('5 more'), 5)
+        self.assertEqual(_parse_count('7 million'), 7)
+    
+    def test_no_number(self):
+        self.assertEqual(_parse_count(''), 0)
+        self.assertEqual(_parse_count('Like'), 0)
+
+
+
+class IsBlockedUrlTest(unittest.TestCase):
+    def test_blocked_domains_and_subdomains(self):
+        self.assertTrue(_is_blocked_url('https://ads.linkedin.com/collect?v=1'))
+        self.assertTrue(_is_blocked_url('https://stats.g.doubleclick.net/j/collect'))
+        self.assertTrue(_is_blocked_url('https://www.googletagmanager.com/gtm.js?id=X'))
+        self.assertTrue(_is_blocked_url('https://WWW.Google-Analytics.com/analytics.js'))
+    
+    def test_lookalike_hosts_are_not_blocked(self):
+        self.assertFalse(_is_blocked_url('https://uploads.linkedin.com/media/1'))
+        self.assertFalse(_is_blocked_url('https://leads.linkedin.com/li.lms-analytics'))
+        self.assertFalse(_is_blocked_url('https://notdoubleclick.net/x'))
+    
+    def test_blocked_domain_in_query_string_is_not_blocked(self):
+        self.assertFalse(_is_blocked_url('https://www.linkedin.com/feed/?ref=googletagmanager.com'))
+        self.assertFalse(_is_blocked_url('https://www.linkedin.com/redir?url=https://ad.doubleclick.net/'))
+    
+    def test_urls_without_a_host(self):
+        self.assertFalse(_is_blocked_url('data:text/plain,ads.linkedin.com'))
+        self.assertFalse(_is_blocked_url('about:blank'))
+
+
+if __name__ == '__main__':
+    unittest.main()
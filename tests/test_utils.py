@@ -0,0 +1,90 @@
+"""
+Tests for keyword matching and relevance scoring in utils.py.
+"""
+import random
+import re
+import unittest
+
+from utils import (
+    KeywordMatcher,
+    _keyword_key,
+    _trie_pattern,
+    calculate_relevance_score,
+    calculate_relevance_scores,
+)
+
+
+def per_keyword_score(text, keywords):
+    """The original scoring loop: one whole-word regex scan per keyword."""
+    text_lower = text.lower()
+    return sum(len(re.findall(r'\b' + re.escape(keyword.lower()) + r'\b', text_lower)) for keyword in keywords)
+
+
+class TriePatternTest(unittest.TestCase):
+    def test_single_keyword(self):
+        self.assertEqual(_trie_pattern(('hiring',)), 'hiring')
+    
+    def test_shared_prefixes_are_factored(self):
+        keywords = _keyword_key(['engineer', 'engineering', 'enterprise'])
+        self.assertEqual(_trie_pattern(keywords), 'en(?:gineer(?:ing)?|terprise)')
+    
+    def test_keyword_that_prefixes_another_is_optional_tail(self):
+        self.assertEqual(_trie_pattern(_keyword_key(['a', 'ab', 'abc'])), 'a(?:b(?:c)?)?')
+    
+    def test_no_shared_prefix(self):
+        keywords = _keyword_key(['founding team', 'team'])
+        self.assertEqual(_trie_pattern(keywords), '(?:' + re.escape('founding team') + '|team)')
+    
+    def test_matches_exactly_the_keywords(self):
+        keywords = _keyword_key(['go', 'golang', 'google', 'c++'])
+        pattern = re.compile('(?:' + _trie_pattern(keywords) + ')')
+        for keyword in keywords:
+            self.assertTrue(pattern.fullmatch(keyword), keyword)
+        for other in ('g', 'goo', 'golan', 'c+', 'c'):
+            self.assertFalse(pattern.fullmatch(other), other)
+
+
+class KeywordKeyTest(unittest.TestCase):
+    def test_lowercases_dedupes_and_orders_longest_first(self):
+        self.assertEqual(_keyword_key(['Go', 'python', 'Python', '', 'rust']), ('python', 'rust', 'go'))
+
+
+class RelevanceScoreTest(unittest.TestCase):
+    KEYWORDS = ['hiring', 'Python', 'backend engineer', 'founding', 'C++', 'remote']
+    
+    def test_matches_per_keyword_counts_for_non_overlapping_keywords(self):
+        texts = [
+            "We're HIRING! Python backend engineer, remote. Hiring fast.",
+            "Founding team: python/C++ devs, hiring-now (remote-first)",
+            "pythonic code, rehiring, unfounding",
+            "",
+            "Nothing relevant here.",
+        ]
+        matcher = KeywordMatcher(self.KEYWORDS)
+        expected = [per_keyword_score(text, self.KEYWORDS) for text in texts]
+        
+        self.assertEqual([calculate_relevance_score(text, self.KEYWORDS) for text in texts], expected)
+        self.assertEqual(calculate_relevance_scores(texts, matcher), expected)
+    
+    def test_matches_per_keyword_counts_on_random_texts(self):
+        words = ['hiring', 'python', 'pythons', 'backend', 'engineer', 'founding', 'remote', 'x', 'c++', '.', ',']
+        rng = random.Random(0)
+        for _ in range(500):
+            text = ' '.join(rng.choice(words) for _ in range(rng.randint(0, 20)))
+            self.assertEqual(calculate_relevance_score(text, self.KEYWORDS), per_keyword_score(text, self.KEYWORDS), text)
+    
+    def test_duplicate_keywords_count_once(self):
+        self.assertEqual(calculate_relevance_score('Python jobs', ['Python', 'python']), 1)
+    
+    def test_overlapping_keywords_prefer_the_longest_match(self):
+        keywords = ['team', 'founding team']
+        self.assertEqual(calculate_relevance_score('Join our founding team and team up', keywords), 2)
+    
+    def test_empty_inputs_score_zero(self):
+        self.assertEqual(calculate_relevance_score('', ['hiring']), 0)
+        self.assertEqual(calculate_relevance_score('hiring', []), 0)
+        self.assertEqual(calculate_relevance_scores(['hiring'], KeywordMatcher([])), [0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,7 +3,54 @@ Utility functions for hashing, keyword matching, and text processing.
 """
 import hashlib
 import re
-from typing import List, Set
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Optional, Pattern, Set, Tuple
+
+# Total input size (bytes) above which hash_many hashes in a thread pool
+HASH_PARALLEL_THRESHOLD = 1 << 20
+
+# Largest keyword list KeywordMatcher pre-filters with plain substring checks
+PREFILTER_MAX_KEYWORDS = 32
+
+
+def fast_hash(data: bytes) -> str:
+    """
+    Hash bytes into a short identifier for in-memory keys.
+    
+    Uses 64-bit BLAKE2b, which is faster than MD5. Its values differ from
+    the MD5-based IDs already stored in output.db, so it must not be used
+    for anything persisted (see fallback_post_url).
+    
+    Args:
+        data: The bytes to hash
+        
+    Returns:
+        A 16-character hexadecimal hash string
+    """
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
+def hash_many(items: List[bytes], max_workers: Optional[int] = None) -> List[str]:
+    """
+    Hash a batch of independent byte strings with fast_hash.
+    
+    hashlib releases the GIL while hashing large buffers, so big batches
+    are spread over a thread pool; small ones are hashed inline, where the
+    pool's overhead would outweigh the gain.
+    
+    Args:
+        items: Byte strings to hash
+        max_workers: Thread count for large batches (defaults to the executor's)
+        
+    Returns:
+        List of hash strings, in the same order as items
+    """
+    if sum(map(len, items)) < HASH_PARALLEL_THRESHOLD:
+        return [fast_hash(item) for item in items]
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(fast_hash, items))
 
 
 def hash_url(url: str) -> str:
@@ -16,7 +63,83 @@ def hash_url(url: str) -> str:
     Returns:
         A hexadecimal hash string
     """
-    return hashlib.md5(url.encode()).hexdigest()
+    return fast_hash(url.encode())
+
+
+def fallback_post_url(text: str) -> str:
+    """
+    Build the synthetic post_url stored for a post that has no link.
+    
+    The ID is derived from the MD5 of the text exactly as the scraper has
+    always derived it, so posts already saved in output.db keep the same
+    URL (and INSERT OR REPLACE key) when they are scraped again. Use
+    fast_hash only for keys that are never persisted.
+    
+    Args:
+        text: The post text as extracted from the page
+        
+    Returns:
+        A https://www.linkedin.com/feed/post/<12 hex digits> URL
+    """
+    return f"https://www.linkedin.com/feed/post/{hashlib.md5(text.encode()).hexdigest()[:12]}"
+
+
+@lru_cache(maxsize=128)
+def _compile_keywords(keywords: Tuple[str, ...]) -> Optional[Pattern]:
+    """
+    Compile a keyword tuple into a single whole-word alternation pattern.
+    
+    Cached, so scoring many texts against the same keywords compiles once.
+    
+    Args:
+        keywords: Lowercased, deduplicated keywords (longest first, so
+            overlapping keywords prefer the longer match)
+        
+    Returns:
+        Compiled pattern, or None if there are no keywords
+    """
+    if not keywords:
+        return None
+    return re.compile(r'\b(?:' + _trie_pattern(keywords) + r')\b')
+
+
+def _trie_pattern(keywords: Tuple[str, ...]) -> str:
+    """
+    Build a regex alternation with the keywords' shared prefixes factored out.
+    
+    For example ("engineer", "engineering", "enterprise") becomes
+    "en(?:gineer(?:ing)?|terprise)", so the regex engine tries each shared
+    prefix once per position instead of once per keyword.
+    
+    Args:
+        keywords: Keywords to match
+        
+    Returns:
+        Regex source matching exactly the given keywords
+    """
+    trie = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = None  # End of a keyword
+    
+    def node_pattern(node: dict) -> str:
+        branches = [re.escape(char) + node_pattern(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if '' in node:
+            # A keyword ends here; the longer continuation is tried first
+            return '(?:' + body + ')?'
+        return body
+    
+    return node_pattern(trie)
+
+
+def _keyword_key(keywords: List[str]) -> Tuple[str, ...]:
+    """Normalize a keyword list into the hashable cache key used by _compile_keywords."""
+    return tuple(sorted({keyword.lower() for keyword in keywords if keyword}, key=lambda k: (-len(k), k)))
 
 
 def calculate_relevance_score(text: str, keywords: List[str]) -> int:
@@ -33,16 +156,76 @@ def calculate_relevance_score(text: str, keywords: List[str]) -> int:
     if not text or not keywords:
         return 0
     
-    text_lower = text.lower()
-    score = 0
+    # Same matcher as the batch path, so both score texts identically
+    return _cached_matcher(tuple(keywords)).count(text)
+
+
+class KeywordMatcher:
+    """
+    Matches a whole keyword list against a text in a single scan.
     
-    for keyword in keywords:
-        # Case-insensitive word boundary matching
-        pattern = r'\b' + re.escape(keyword.lower()) + r'\b'
-        matches = len(re.findall(pattern, text_lower))
-        score += matches
+    All keywords are combined into one compiled alternation pattern, so
+    each text is scanned once instead of once per keyword.
+    """
+    
+    def __init__(self, keywords: List[str]):
+        """
+        Build the matcher.
+        
+        Args:
+            keywords: List of keywords to match (case-insensitive, whole words)
+        """
+        # Longest keywords first so overlapping keywords prefer the longer match
+        self.keywords = list(_keyword_key(keywords))
+        self.pattern = _compile_keywords(tuple(self.keywords))
+        
+        # Substring checks are much cheaper than the regex scan, so texts that
+        # contain no keyword at all are rejected with them first (only worth
+        # it while the keyword list is short)
+        self.prefilter = tuple(self.keywords) if len(self.keywords) <= PREFILTER_MAX_KEYWORDS else None
+    
+    def count(self, text: str) -> int:
+        """
+        Count keyword matches in text.
+        
+        Args:
+            text: The text to scan
+            
+        Returns:
+            Number of (non-overlapping) keyword matches found
+        """
+        if not text or self.pattern is None:
+            return 0
+        
+        text = text.lower()
+        if self.prefilter is not None and not any(keyword in text for keyword in self.prefilter):
+            return 0
+        
+        return len(self.pattern.findall(text))
+
+
+@lru_cache(maxsize=128)
+def _cached_matcher(keywords: Tuple[str, ...]) -> KeywordMatcher:
+    """Build (once per keyword tuple) the KeywordMatcher used by calculate_relevance_score."""
+    return KeywordMatcher(list(keywords))
+
+
+def calculate_relevance_scores(texts: List[str], matcher: KeywordMatcher) -> List[int]:
+    """
+    Calculate relevance scores for a batch of texts.
+    
+    Args:
+        texts: List of post texts to score
+        matcher: KeywordMatcher built once for the keyword list
+        
+    Returns:
+        List of scores, in the same order as texts
+    """
+    if matcher.pattern is None:
+        return [0] * len(texts)
     
-    return score
+    count = matcher.count
+    return [count(text) for text in texts]
 
 
 def normalize_text(text: str) -> str:
@@ -58,11 +241,8 @@ def normalize_text(text: str) -> str:
     if not text:
         return ""
     
-    # Remove extra whitespace and newlines
-    text = re.sub(r'\s+', ' ', text)
-    text = text.strip()
-    
-    return text
+    # Collapse whitespace runs and newlines (split/join runs entirely in C)
+    return ' '.join(text.split())
 
 
 def extract_text_snippet(text: str, max_length: int = 200) -> str:
@@ -82,20 +262,24 @@ def extract_text_snippet(text: str, max_length: int = 200) -> str:
     if len(text) <= max_length:
         return text
     
-    # Try to cut at word boundary
-    snippet = text[:max_length]
-    last_space = snippet.rfind(' ')
+    # Try to cut at word boundary, only searching the last 20% of the snippet
+    # (a space any earlier would make the snippet too short)
+    last_space = text.rfind(' ', int(max_length * 0.8) + 1, max_length)
     
-    if last_space > max_length * 0.8:  # If we found a space reasonably close
-        snippet = snippet[:last_space]
+    if last_space != -1:
+        return text[:last_space] + "..."
     
-    return snippet + "..."
+    return text[:max_length] + "..."
 
 
 def deduplicate_posts(posts: List[dict], key: str = "post_url") -> List[dict]:
     """
     Remove duplicate posts based on a key field.
     
+    Posts missing the key fall back to a hash of their text (the full text
+    for post_url, the first 50 characters otherwise). Those texts are
+    collected first and hashed in one batch.
+    
     Args:
         posts: List of post dictionaries
         key: Field name to use for deduplication
@@ -103,31 +287,31 @@ def deduplicate_posts(posts: List[dict], key: str = "post_url") -> List[dict]:
     Returns:
         List of unique posts (first occurrence kept)
     """
-    seen = set()
-    unique_posts = []
+    post_keys = [post.get(key) for post in posts]
     
-    for post in posts:
-        post_key = post.get(key)
-        # If post_url is empty, use text hash as fallback
-        if not post_key and key == "post_url":
-            text = post.get('text', '')
-            if text:
-                import hashlib
-                post_key = hashlib.md5(text.encode()).hexdigest()
-        
-        # If still no key, use text snippet
+    # Texts of posts with no key, hashed together as fallback keys
+    need_hash = []
+    need_index = []
+    for i, (post, post_key) in enumerate(zip(posts, post_keys)):
         if not post_key:
-            text = post.get('text', '')[:50]
+            text = post.get('text') or ''
+            if key != "post_url":
+                text = text[:50]
             if text:
-                import hashlib
-                post_key = hashlib.md5(text.encode()).hexdigest()
-        
-        if post_key and post_key not in seen:
-            seen.add(post_key)
-            unique_posts.append(post)
-        elif not post_key:
+                need_hash.append(text.encode())
+                need_index.append(i)
+    
+    for i, digest in zip(need_index, hash_many(need_hash)):
+        post_keys[i] = digest
+    
+    seen = set()
+    unique_posts = []
+    for post, post_key in zip(posts, post_keys):
+        if not post_key:
             # If no key at all, still include the post (might be first one)
             unique_posts.append(post)
+        elif post_key not in seen:
+            seen.add(post_key)
+            unique_posts.append(post)
     
     return unique_posts
-